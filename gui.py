@@ -2,12 +2,20 @@
 Enhanced GUI for Virtual Memory Manager
 Modern design with proper scrolling and visibility
 """
+import functools
+import string
+import threading
+from collections import deque
 import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox
-import threading
 import time
+from types import MappingProxyType
 from typing import Dict
-from utils import format_size
+from utils import format_size as _raw_format_size
+
+# Process memory rarely changes between ticks, so the same sizes are
+# formatted over and over — memoize at the GUI boundary
+format_size = functools.lru_cache(maxsize=4096)(_raw_format_size)
 
 
 class ScrollableFrame(ttk.Frame):
@@ -20,31 +28,103 @@ class ScrollableFrame(ttk.Frame):
         scrollbar = ttk.Scrollbar(self, orient="vertical", command=canvas.yview)
         self.scrollable_frame = ttk.Frame(canvas)
         
+        # The frame is the canvas's only item, so its own geometry *is* the
+        # bounding box — no need for the O(items) bbox("all") walk
         self.scrollable_frame.bind(
             "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
+            lambda e: canvas.configure(scrollregion=(0, 0, e.width, e.height))
         )
-        
-        canvas.create_window((0, 0), window=self.scrollable_frame, anchor="nw")
+
+        self._canvas = canvas
+        self._window_id = canvas.create_window((0, 0), window=self.scrollable_frame, anchor="nw")
         canvas.configure(yscrollcommand=scrollbar.set)
+
+        # Debounce resize storms: a window drag fires <Configure> per pixel,
+        # so only apply the final width after the drag settles
+        self._resize_after_id = None
+        canvas.bind("<Configure>", self._on_canvas_configure)
         
         canvas.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
-        
-        # Bind mouse wheel
-        self.scrollable_frame.bind('<Enter>', lambda e: self._bind_mousewheel(canvas))
-        self.scrollable_frame.bind('<Leave>', lambda e: self._unbind_mousewheel(canvas))
-        
-    def _bind_mousewheel(self, canvas):
-        canvas.bind_all("<MouseWheel>", lambda e: canvas.yview_scroll(int(-1*(e.delta/120)), "units"))
-        
-    def _unbind_mousewheel(self, canvas):
-        canvas.unbind_all("<MouseWheel>")
+
+        # Bind mouse wheel on the widgets themselves rather than globally,
+        # so wheel events over unrelated widgets never reach this handler.
+        # The handler is specialized once per platform: Windows reports
+        # delta in multiples of 120, macOS in scroll units, and X11 sends
+        # wheel motion as Button-4/5 presses instead of <MouseWheel>
+        ws = self.tk.call('tk', 'windowingsystem')
+        if ws == 'win32':
+            self._on_mousewheel = lambda e: canvas.yview_scroll(-(e.delta // 120), "units")
+            self._wheel_events = ("<MouseWheel>",)
+        elif ws == 'aqua':
+            self._on_mousewheel = lambda e: canvas.yview_scroll(-e.delta, "units")
+            self._wheel_events = ("<MouseWheel>",)
+        else:
+            self._on_mousewheel = lambda e: canvas.yview_scroll(-1 if e.num == 4 else 1, "units")
+            self._wheel_events = ("<Button-4>", "<Button-5>")
+        self.bind_mousewheel(canvas)
+        self.bind_mousewheel(self.scrollable_frame)
+
+    def _on_canvas_configure(self, event):
+        if self._resize_after_id is not None:
+            self.after_cancel(self._resize_after_id)
+        self._resize_after_id = self.after(50, self._apply_width, event.width)
+
+    def _apply_width(self, width):
+        self._resize_after_id = None
+        self._canvas.itemconfig(self._window_id, width=width)
+
+    def bind_mousewheel(self, widget):
+        """Bind the wheel handler to a widget and all its descendants"""
+        for event in self._wheel_events:
+            widget.bind(event, self._on_mousewheel)
+        for child in widget.winfo_children():
+            self.bind_mousewheel(child)
 
 
 class VirtualMemoryGUI:
     """Enhanced GUI Application for Virtual Memory Manager"""
-    
+
+    # One %-interpolation per fault instead of a multi-segment f-string;
+    # this runs on the simulation thread under fault storms
+    _FAULT_FMT = ("⚠️  PAGE FAULT | Process: %s (PID: %s) | "
+                  "Page %s → Frame %s | Recovery: %.3f ms | Total: %s")
+
+    # The stats block is constant apart from ~15 numeric fields; keeping it
+    # as a precompiled Template means the box-drawing/emoji literals are
+    # never reprocessed at update time
+    _STATS_TMPL = string.Template("""\
+╔══════════════════════════════════╗
+║      SYSTEM STATISTICS           ║
+╚══════════════════════════════════╝
+
+📊 Process Information
+   • Active Processes: $total_processes
+   • Total Frames: $frames_total
+   • Frames in Use: $frames_used
+   • Frame Usage: $frame_usage_pct%
+
+📄 Page Management
+   • Total Accesses: $total_accesses
+   • Page Faults: $page_faults
+   • Fault Rate: $fault_rate%
+   • Hit Rate: $hit_rate%
+
+⚡ Performance Metrics
+   • Avg Recovery: $avg_recovery ms
+   • Best Recovery: $best_recovery ms
+   • Worst Recovery: $worst_recovery ms
+
+⚙️ Current Configuration
+   • Algorithm: $algorithm
+   • Page Size: $page_size KB
+   • Total Memory: $total_memory KB
+   • Used Memory: $used_memory KB
+
+📈 Algorithm Performance
+   • Page Hits: $algo_hits
+   • Hit Rate: $algo_hit_rate%""")
+
     def __init__(self, config: Dict, vm_manager, process_monitor):
         self.config = config
         self.vm_manager = vm_manager
@@ -55,8 +135,8 @@ class VirtualMemoryGUI:
         self.root.geometry("1600x900")
         self.root.state('zoomed')  # Start maximized
         
-        # Modern color scheme
-        self.colors = {
+        # Modern color scheme (read-only; callbacks may share it freely)
+        self.colors = MappingProxyType({
             'bg': '#f5f6fa',
             'primary': '#3498db',
             'success': '#2ecc71',
@@ -67,14 +147,66 @@ class VirtualMemoryGUI:
             'white': '#ffffff',
             'text_dark': '#2c3e50',
             'text_light': '#7f8c8d'
-        }
+        })
         
+        # Hot-path color lookups bound once (used every refresh tick)
+        self._c_success = self.colors['success']
+        self._c_warning = self.colors['warning']
+        self._c_danger = self.colors['danger']
+
         self.root.configure(bg=self.colors['bg'])
         
         self.running = False
-        self.update_thread = None
         self.update_scheduled = False  # Prevent multiple scheduled updates
-        self.last_update_time = 0  # Track last update time
+        self._dirty = False  # Tracked state changed since last redraw
+
+        # Dialogs are built once on first use and then hidden/reshown;
+        # rebuilding the whole widget tree per click is the expensive part
+        self._add_dialog = None
+        self._add_dialog_show = None
+        self._browse_dialog = None
+        self._browse_dialog_show = None
+
+        # Inline confirmation banner (built lazily); pending action to run
+        # if the user confirms
+        self._confirm_banner = None
+        self._confirm_label = None
+        self._confirm_action = None
+
+        # Row caches for diff-based Treeview updates (iid -> last values)
+        self._proc_row_cache = {}  # pid -> values tuple
+        self._frame_row_cache = {}  # frame index -> (values tuple, tag)
+
+        # Fingerprints of the last rendered data, to skip redraws entirely
+        self._proc_sig = None
+        self._frame_sig = None
+        self._stats_sig = None
+
+        # "Frame N" labels are reused forever; build each string once
+        self._frame_label_cache = {}
+
+        # Last rendered stats block, to skip no-op rewrites and to diff
+        # against line by line
+        self._last_stats_str = None
+        self._last_stats_lines = []
+
+        # Log ring-buffer bookkeeping: trim one line per append once full
+        self._log_max_lines = 500
+        self._log_line_count = 0
+
+        # Fault messages queue up here and are flushed to the log in one
+        # batch per drain tick, so a fault storm can't flood the Tk event
+        # queue with one callback per fault
+        self._fault_queue = deque()
+
+        # Last badge contents, so unchanged labels skip the Tk reflow
+        self._last_proc_count_text = None
+        self._last_frame_usage = None  # (text, bg)
+
+        # Running best/worst fault recovery, updated per fault instead of
+        # scanning the whole recovery history every refresh
+        self._best_recovery = float('inf')
+        self._worst_recovery = 0.0
         
         # Style configuration
         self._setup_styles()
@@ -83,7 +215,10 @@ class VirtualMemoryGUI:
         
         # Set up periodic update using after() instead of thread
         self.update_interval = 1500  # 1.5 seconds between updates
-        
+
+        # Drain queued fault messages on a fixed tick
+        self.root.after(100, self._drain_faults)
+
     def _setup_styles(self):
         """Setup modern ttk styles"""
         style = ttk.Style()
@@ -111,6 +246,7 @@ class VirtualMemoryGUI:
         # Main container
         main_container = tk.Frame(self.root, bg=self.colors['bg'])
         main_container.pack(fill=tk.BOTH, expand=True)
+        self._main_container = main_container
         
         # Configure grid for main container
         main_container.columnconfigure(0, weight=1)
@@ -118,69 +254,37 @@ class VirtualMemoryGUI:
         
         # === HEADER ===
         self._create_header(main_container)
-        
-        # === SCROLLABLE CONTENT AREA ===
-        # Create canvas for scrolling
-        canvas = tk.Canvas(main_container, bg=self.colors['bg'], highlightthickness=0)
-        scrollbar = ttk.Scrollbar(main_container, orient="vertical", command=canvas.yview)
-        
-        scrollable_frame = tk.Frame(canvas, bg=self.colors['bg'])
-        
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
-        
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw", width=canvas.winfo_reqwidth())
-        canvas.configure(yscrollcommand=scrollbar.set)
-        
-        canvas.grid(row=1, column=0, sticky="nsew", padx=15, pady=(10, 15))
-        scrollbar.grid(row=1, column=1, sticky="ns", pady=(10, 15))
-        
-        # Bind mouse wheel to canvas
-        def _on_mousewheel(event):
-            canvas.yview_scroll(int(-1*(event.delta/120)), "units")
-        
-        canvas.bind_all("<MouseWheel>", _on_mousewheel)
-        
-        # Make canvas expand with window
-        def _configure_canvas(event):
-            canvas.itemconfig(canvas.find_withtag("all")[0], width=event.width)
-        
-        canvas.bind('<Configure>', _configure_canvas)
-        
+
         # === CONTENT LAYOUT ===
-        content_frame = tk.Frame(scrollable_frame, bg=self.colors['bg'])
-        content_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-        
-        # Configure grid weights for responsive layout
-        content_frame.columnconfigure(0, weight=0, minsize=350)  # Left panel fixed width
-        content_frame.columnconfigure(1, weight=1)  # Right panel expandable
-        content_frame.rowconfigure(0, weight=1)
-        
-        # Left panel container
-        left_panel = tk.Frame(content_frame, bg=self.colors['bg'])
-        left_panel.grid(row=0, column=0, sticky="nsew", padx=(0, 10))
-        
+        # A native paned window lets Tk's C-level pane manager handle the
+        # split layout; no Python <Configure> handlers or bbox walks needed
+        paned = ttk.Panedwindow(main_container, orient='horizontal')
+        paned.grid(row=1, column=0, sticky="nsew", padx=15, pady=(10, 15))
+
+        # Left panel (control + statistics); the statistics text carries its
+        # own scrollbar, so no extra scroll wrapper is needed around it
+        left_panel = tk.Frame(paned, bg=self.colors['bg'])
+        paned.add(left_panel, weight=0)
+
         # Right panel container
-        right_panel = tk.Frame(content_frame, bg=self.colors['bg'])
-        right_panel.grid(row=0, column=1, sticky="nsew")
-        
+        right_panel = tk.Frame(paned, bg=self.colors['bg'])
+        paned.add(right_panel, weight=1)
+
         # Configure right panel grid
         right_panel.rowconfigure(0, weight=1)
         right_panel.rowconfigure(1, weight=1)
         right_panel.rowconfigure(2, weight=1)
         right_panel.columnconfigure(0, weight=1)
-        
+
         # === LEFT PANEL WIDGETS ===
         self._create_control_panel(left_panel)
         self._create_statistics_panel(left_panel)
-        
+
         # === RIGHT PANEL WIDGETS ===
         self._create_process_panel(right_panel)
         self._create_frame_table_panel(right_panel)
         self._create_log_panel(right_panel)
-        
+
     def _create_header(self, parent):
         """Create modern header with title and status"""
         header = tk.Frame(parent, bg=self.colors['primary'], height=70)
@@ -673,33 +777,34 @@ class VirtualMemoryGUI:
         """Schedule the next update using root.after()"""
         if not self.running or not self.root or not self.root.winfo_exists():
             return
-        
-        # Perform update
-        self._safe_update_displays()
-        
+
+        # Defer the actual update until Tk is idle so pending layout and
+        # paint work (scrolling, resizing) drains first; the flag collapses
+        # overlapping requests into a single idle callback
+        if not self.update_scheduled:
+            self.update_scheduled = True
+            self.root.after_idle(self._run_scheduled_update)
+
         # Schedule next update
         if self.running:
             self.root.after(self.update_interval, self._schedule_update)
-    
-    def _update_loop(self):
-        """Update GUI periodically"""
-        while self.running:
-            try:
-                # Schedule update on main thread
-                if self.root and self.root.winfo_exists():
-                    try:
-                        self.root.after(0, self._safe_update_displays)
-                    except tk.TclError:
-                        break
-                else:
-                    break
-                    
-                time.sleep(1.0)  # Increased from 0.5s to reduce load
-            except Exception as e:
-                print(f"Update loop error: {e}")
-                break
-        
-        print("Update loop stopped")
+
+    def _run_scheduled_update(self):
+        """Idle-time callback that performs the deferred display update"""
+        self.update_scheduled = False
+        self._dirty = False
+        self._safe_update_displays()
+
+    def _mark_dirty(self):
+        """Note that tracked state changed without redrawing synchronously
+
+        Repeated changes (e.g. removing several processes in a row) collapse
+        into the single idle redraw already used by the periodic schedule.
+        """
+        self._dirty = True
+        if not self.update_scheduled and self.root and self.root.winfo_exists():
+            self.update_scheduled = True
+            self.root.after_idle(self._run_scheduled_update)
     
     def _safe_update_displays(self):
         """Safely update all display elements with error handling"""
@@ -708,19 +813,17 @@ class VirtualMemoryGUI:
                 return
             if not self.running:
                 return
-            
-            # Throttle updates - prevent too frequent updates
-            current_time = time.time()
-            if current_time - self.last_update_time < 1.0:  # Minimum 1 second between updates
-                return
-            
-            self.last_update_time = current_time
-            
-            # Update displays efficiently
+
+            # Update displays efficiently; rate limiting is handled by the
+            # after(update_interval) schedule, so no wall-clock throttle here.
+            # One stats snapshot feeds every consumer, and Tk flushes the
+            # accumulated widget changes once at the end of the batch
+            stats = self.vm_manager.get_statistics()
             self._update_process_list()
             self._update_frame_table()
-            self._update_statistics()
-            
+            self._update_statistics(stats)
+            self.root.update_idletasks()
+
         except tk.TclError as e:
             print(f"TclError in display update: {e}")
             self.running = False
@@ -732,139 +835,202 @@ class VirtualMemoryGUI:
         self._safe_update_displays()
     
     def _update_process_list(self):
-        """Update the process list"""
+        """Update the process list, touching only rows that changed"""
         try:
-            # Get current items to avoid unnecessary updates
-            current_items = set(self.process_tree.get_children())
             processes = self.process_monitor.get_tracked_processes()
-            
-            # Check if update is needed
-            if len(current_items) == len(processes):
-                # Quick check - if count matches, might not need full update
+
+            # Skip the redraw entirely when nothing changed since last tick
+            sig = (self.running,
+                   hash(tuple((p.pid, p.memory_kb, p.pages_needed) for p in processes)))
+            if sig == self._proc_sig:
                 return
-            
-            # Clear and rebuild
-            for item in current_items:
-                self.process_tree.delete(item)
-            
-            # Add tracked processes
+
+            # Build the new snapshot keyed by pid; status and the stripe
+            # tags are loop-invariant, so compute them once. The tag tuples
+            # are shared literals — no per-row tuple construction
+            status = "✓ Active" if self.running else "⏸ Paused"
+            tag_cycle = (('evenrow',), ('oddrow',))
+            new_rows = {}
             for idx, process in enumerate(processes):
-                status = "✓ Active" if self.running else "⏸ Paused"
-                tag = 'evenrow' if idx % 2 == 0 else 'oddrow'
-                
-                self.process_tree.insert('', tk.END, values=(
+                new_rows[process.pid] = ((
                     process.pid,
                     process.name,
                     format_size(process.memory_kb * 1024),
                     process.pages_needed,
                     status
-                ), tags=(tag,))
-            
-            # Update process count badge
-            self.process_count_label.config(text=f"{len(processes)} process{'es' if len(processes) != 1 else ''}")
+                ), tag_cycle[idx & 1])
+
+            # Remove rows for processes that are gone
+            for pid in self._proc_row_cache.keys() - new_rows.keys():
+                self.process_tree.delete(str(pid))
+
+            # Insert new rows / update changed rows in place
+            pending_inserts = []
+            for pid, (values, tags) in new_rows.items():
+                cached = self._proc_row_cache.get(pid)
+                if cached == (values, tags):
+                    continue
+                if cached is not None:
+                    self.process_tree.item(str(pid), values=values, tags=tags)
+                else:
+                    pending_inserts.append((str(pid), values, tags))
+            if pending_inserts:
+                self._bulk_insert(self.process_tree, pending_inserts)
+
+            self._proc_row_cache = new_rows
+            # Only cache the signature once the widget work succeeded, so
+            # a transient Tcl error can't leave a stale-but-matching
+            # signature that suppresses the retry on the next tick
+            self._proc_sig = sig
+
+            # Update process count badge only when the text changed
+            suffix = 'es' if len(processes) != 1 else ''
+            text = f"{len(processes)} process{suffix}"
+            if text != self._last_proc_count_text:
+                self._last_proc_count_text = text
+                self.process_count_label.config(text=text)
         except Exception as e:
             print(f"Process list update error: {e}")
-    
+
     def _update_frame_table(self):
-        """Update the frame table display"""
+        """Update the frame table display, touching only rows that changed"""
         try:
-            # Clear existing items
-            for item in self.frame_tree.get_children():
-                self.frame_tree.delete(item)
-            
-            # Add frame information
             frames = self.vm_manager.get_frame_visualization()
+
+            # Skip the redraw entirely when nothing changed since last tick
+            sig = hash(tuple((f['frame'], f['pid'], f['page']) for f in frames))
+            if sig == self._frame_sig:
+                return
+
             occupied_count = 0
-            
+
+            label_cache = self._frame_label_cache
+            occupied_tags = ('occupied',)
+            empty_tags = ('empty',)
+            new_rows = {}
             for frame_info in frames:
+                idx = frame_info['frame']
+                label = label_cache.get(idx)
+                if label is None:
+                    label = label_cache[idx] = f"Frame {idx}"
                 if frame_info['pid'] is not None:
-                    tag = 'occupied'
                     occupied_count += 1
-                    self.frame_tree.insert('', tk.END, values=(
-                        f"Frame {frame_info['frame']}",
+                    new_rows[idx] = ((
+                        label,
                         frame_info['pid'],
                         frame_info['page'],
                         frame_info['process_name']
-                    ), tags=(tag,))
+                    ), occupied_tags)
                 else:
-                    tag = 'empty'
-                    self.frame_tree.insert('', tk.END, values=(
-                        f"Frame {frame_info['frame']}",
+                    new_rows[idx] = ((
+                        label,
                         "—",
                         "—",
                         "Empty"
-                    ), tags=(tag,))
-            
-            # Update frame usage badge
+                    ), empty_tags)
+
+            # Remove rows for frames that no longer exist (frame count reduced)
+            for idx in self._frame_row_cache.keys() - new_rows.keys():
+                self.frame_tree.delete(str(idx))
+
+            pending_inserts = []
+            for idx, (values, tags) in new_rows.items():
+                cached = self._frame_row_cache.get(idx)
+                if cached == (values, tags):
+                    continue
+                if cached is not None:
+                    self.frame_tree.item(str(idx), values=values, tags=tags)
+                else:
+                    pending_inserts.append((str(idx), values, tags))
+            if pending_inserts:
+                self._bulk_insert(self.frame_tree, pending_inserts)
+
+            self._frame_row_cache = new_rows
+            # Cached only after the widget work succeeded (see
+            # _update_process_list)
+            self._frame_sig = sig
+
+            # Update frame usage badge; color-coded by usage percentage,
+            # text and background in one config call so Tk reflows once
             total_frames = len(frames)
-            self.frame_usage_label.config(text=f"{occupied_count}/{total_frames} frames")
-            
-            # Color code based on usage percentage
             usage_pct = (occupied_count / total_frames * 100) if total_frames > 0 else 0
-            if usage_pct < 50:
-                self.frame_usage_label.config(bg=self.colors['success'])
-            elif usage_pct < 80:
-                self.frame_usage_label.config(bg=self.colors['warning'])
-            else:
-                self.frame_usage_label.config(bg=self.colors['danger'])
+            bg = (self._c_success if usage_pct < 50
+                  else self._c_warning if usage_pct < 80
+                  else self._c_danger)
+            usage = (f"{occupied_count}/{total_frames} frames", bg)
+            if usage != self._last_frame_usage:
+                self._last_frame_usage = usage
+                self.frame_usage_label.config(text=usage[0], bg=bg)
         except Exception as e:
             print(f"Frame table update error: {e}")
     
-    def _update_statistics(self):
+    @staticmethod
+    def _bulk_insert(tree, rows):
+        """Insert many rows via direct Tcl calls, bypassing the per-call
+        overhead of Treeview.insert"""
+        tcl_call = tree.tk.call
+        widget = tree._w
+        for iid, values, tags in rows:
+            tcl_call(widget, 'insert', '', 'end',
+                     '-id', iid, '-values', values, '-tags', tags)
+
+    def _update_statistics(self, stats=None):
         """Update statistics display without auto-scrolling"""
         try:
-            stats = self.vm_manager.get_statistics()
-            
-            # CRITICAL: Save scroll position BEFORE any changes
-            try:
-                scroll_position = self.stats_text.yview()
-                saved_position = scroll_position[0] if scroll_position else 0.0
-            except:
-                saved_position = 0.0
-            
-            # Disable auto-scroll by preventing text widget from updating view
-            self.stats_text.config(state='normal')
-            
-            stats_text = f"""
-╔══════════════════════════════════╗
-║      SYSTEM STATISTICS           ║
-╚══════════════════════════════════╝
+            if stats is None:
+                stats = self.vm_manager.get_statistics()
 
-📊 Process Information
-   • Active Processes: {stats['total_processes']}
-   • Total Frames: {stats['frames_total']}
-   • Frames in Use: {stats['frames_used']}
-   • Frame Usage: {(stats['frames_used']/stats['frames_total']*100) if stats['frames_total'] > 0 else 0:.1f}%
+            # Skip the rewrite entirely when the stats are unchanged
+            sig = hash(tuple(sorted(
+                (k, v) for k, v in stats.items() if not isinstance(v, dict)
+            )) + tuple(sorted(stats['algorithm_stats'].items())))
+            if sig == self._stats_sig:
+                return
+            self._stats_sig = sig
 
-📄 Page Management
-   • Total Accesses: {stats['total_page_accesses']:,}
-   • Page Faults: {stats['total_page_faults']:,}
-   • Fault Rate: {stats['page_fault_rate']:.2f}%
-   • Hit Rate: {100 - stats['page_fault_rate']:.2f}%
+            frames_total = stats['frames_total']
+            frames_used = stats['frames_used']
+            page_size = self.vm_manager.page_size_kb
+            algo_stats = stats['algorithm_stats']
+            stats_text = self._STATS_TMPL.substitute(
+                total_processes=stats['total_processes'],
+                frames_total=frames_total,
+                frames_used=frames_used,
+                frame_usage_pct=f"{(frames_used / frames_total * 100) if frames_total > 0 else 0:.1f}",
+                total_accesses=f"{stats['total_page_accesses']:,}",
+                page_faults=f"{stats['total_page_faults']:,}",
+                fault_rate=f"{stats['page_fault_rate']:.2f}",
+                hit_rate=f"{100 - stats['page_fault_rate']:.2f}",
+                avg_recovery=f"{stats['avg_recovery_time_ms']:.3f}",
+                best_recovery=f"{self._best_recovery if self._worst_recovery else 0:.3f}",
+                worst_recovery=f"{self._worst_recovery:.3f}",
+                algorithm=self.vm_manager.algorithm_name,
+                page_size=page_size,
+                total_memory=frames_total * page_size,
+                used_memory=frames_used * page_size,
+                algo_hits=algo_stats['page_hits'],
+                algo_hit_rate=f"{algo_stats['hit_rate']:.2f}",
+            )
 
-⚡ Performance Metrics
-   • Avg Recovery: {stats['avg_recovery_time_ms']:.3f} ms
-   • Best Recovery: {min(self.vm_manager.fault_recovery_times) if self.vm_manager.fault_recovery_times else 0:.3f} ms
-   • Worst Recovery: {max(self.vm_manager.fault_recovery_times) if self.vm_manager.fault_recovery_times else 0:.3f} ms
+            if stats_text == self._last_stats_str:
+                return
+            self._last_stats_str = stats_text
 
-⚙️ Current Configuration
-   • Algorithm: {self.vm_manager.algorithm_name}
-   • Page Size: {self.vm_manager.page_size_kb} KB
-   • Total Memory: {stats['frames_total'] * self.vm_manager.page_size_kb} KB
-   • Used Memory: {stats['frames_used'] * self.vm_manager.page_size_kb} KB
+            # Rewrite only the lines whose content changed; unchanged lines
+            # keep their render state and anchors, so the scroll position is
+            # never disturbed. Falls back to a full replace if the line
+            # count shifts (shouldn't happen with a fixed template)
+            new_lines = stats_text.split('\n')
+            old_lines = self._last_stats_lines
+            if len(new_lines) != len(old_lines):
+                self.stats_text.replace('1.0', tk.END, stats_text)
+            else:
+                replace = self.stats_text.replace
+                for i, (old, new) in enumerate(zip(old_lines, new_lines)):
+                    if old != new:
+                        replace(f'{i + 1}.0', f'{i + 1}.end', new)
+            self._last_stats_lines = new_lines
 
-📈 Algorithm Performance
-   • Page Hits: {stats['algorithm_stats']['page_hits']}
-   • Hit Rate: {stats['algorithm_stats']['hit_rate']:.2f}%
-            """.strip()
-            
-            # Update text content
-            self.stats_text.delete('1.0', tk.END)
-            self.stats_text.insert('1.0', stats_text)
-            
-            # CRITICAL: Restore exact scroll position to prevent auto-scrolling
-            self.stats_text.yview_moveto(saved_position)
-            
         except Exception as e:
             print(f"Statistics update error: {e}")
     
@@ -882,7 +1048,12 @@ class VirtualMemoryGUI:
     
     def _add_process_dialog(self):
         """Show modern dialog to add process by PID"""
+        if self._add_dialog is not None and self._add_dialog.winfo_exists():
+            self._add_dialog_show()
+            return
+
         dialog = tk.Toplevel(self.root)
+        self._add_dialog = dialog
         dialog.title("Add Process by PID")
         dialog.geometry("400x200")
         dialog.configure(bg=self.colors['white'])
@@ -925,6 +1096,17 @@ class VirtualMemoryGUI:
         pid_entry.pack(fill=tk.X, ipady=8)
         pid_entry.focus()
         
+        def close_dialog():
+            dialog.grab_release()
+            dialog.withdraw()
+
+        def show_dialog():
+            pid_entry.delete(0, tk.END)
+            dialog.deiconify()
+            dialog.lift()
+            dialog.grab_set()
+            pid_entry.focus()
+
         def add_process():
             try:
                 pid = int(pid_entry.get())
@@ -932,7 +1114,7 @@ class VirtualMemoryGUI:
                 if process_info:
                     self.vm_manager.add_process(process_info)
                     self._log(f"✅ Added process: {process_info.name} (PID: {pid})", 'success')
-                    dialog.destroy()
+                    close_dialog()
                 else:
                     messagebox.showerror("Error", "Could not add process.\n\nPossible reasons:\n• Invalid PID\n• Access denied\n• Process not found")
             except ValueError:
@@ -958,7 +1140,7 @@ class VirtualMemoryGUI:
         cancel_btn = tk.Button(
             btn_frame,
             text="Cancel",
-            command=dialog.destroy,
+            command=close_dialog,
             bg=self.colors['light'],
             fg=self.colors['text_dark'],
             font=('Segoe UI', 10, 'bold'),
@@ -968,13 +1150,22 @@ class VirtualMemoryGUI:
             cursor='hand2'
         )
         cancel_btn.pack(side=tk.LEFT, expand=True, fill=tk.X, padx=(5, 0))
-        
+
         # Bind Enter key
         pid_entry.bind('<Return>', lambda e: add_process())
+
+        # Hide instead of destroy so the next open is near-instant
+        dialog.protocol('WM_DELETE_WINDOW', close_dialog)
+        self._add_dialog_show = show_dialog
     
     def _browse_processes(self):
         """Show modern dialog to browse all processes"""
+        if self._browse_dialog is not None and self._browse_dialog.winfo_exists():
+            self._browse_dialog_show()
+            return
+
         dialog = tk.Toplevel(self.root)
+        self._browse_dialog = dialog
         dialog.title("Browse Processes")
         dialog.geometry("800x600")
         dialog.configure(bg=self.colors['white'])
@@ -1074,68 +1265,108 @@ class VirtualMemoryGUI:
         tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
-        # Add alternating colors
-        tree.tag_configure('oddrow', background='#f9f9f9')
-        tree.tag_configure('evenrow', background='#ffffff')
-        
-        def refresh_list(search_term=""):
-            for item in tree.get_children():
-                tree.delete(item)
-            
+        # (iid, lowercase name, pid string) for every row, so filtering
+        # can run against cached strings without touching psutil again
+        all_items = []
+
+        def refresh_list():
+            # A system-wide psutil scan is slow enough to freeze the UI,
+            # so enumerate on a worker thread and marshal the results
+            # back to the Tk thread for the widget updates
+            threading.Thread(target=enumerate_processes, daemon=True).start()
+
+        def enumerate_processes():
             processes = self.process_monitor.get_all_processes()
             # Sort by name
-            processes.sort(key=lambda x: x['name'].lower())
-            
-            # Filter processes based on search term
-            filtered_processes = []
-            search_lower = search_term.lower()
-            
+            processes.sort(key=lambda x: x['_name_lower'])
+            # Format memory sizes here so the Tk-thread insert loop only
+            # reads precomputed strings
             for proc in processes:
+                proc['_memory_fmt'] = format_size(proc['memory_kb'] * 1024)
+            self.root.after(0, populate_tree, processes)
+
+        def populate_tree(processes):
+            if not tree.winfo_exists():
+                return
+
+            # One variadic Tcl call instead of one delete per row
+            children = tree.get_children()
+            if children:
+                tree.delete(*children)
+
+            all_items.clear()
+            # No per-row stripe tags here: applying a tag per insert is a
+            # separate Tcl operation for every one of several hundred rows,
+            # and detach/reattach filtering would scramble the stripes anyway
+            for proc in processes:
+                iid = tree.insert('', tk.END, values=(
+                    proc['pid'],
+                    proc['name'],
+                    proc['_memory_fmt']
+                ))
+                all_items.append((iid, proc['_name_lower'], proc['_pid_str']))
+
+            apply_filter(search_var.get())
+
+        def apply_filter(search_term):
+            # The tree is populated once per refresh; filtering just hides
+            # non-matching rows via detach/reattach, which keeps tags,
+            # selection and scroll state and avoids rebuilding the tree
+            if not tree.winfo_exists():
+                return
+
+            search_lower = search_term.lower()
+            shown = 0
+
+            for iid, name_lower, pid_str in all_items:
                 # Search in process name and PID
-                if (search_lower in proc['name'].lower() or 
-                    search_term in str(proc['pid']) or
-                    search_term == ""):
-                    filtered_processes.append(proc)
-            
+                if (not search_term or
+                        search_lower in name_lower or
+                        search_term in pid_str):
+                    tree.reattach(iid, '', tk.END)
+                    shown += 1
+                else:
+                    tree.detach(iid)
+
+            total_count = len(all_items)
+
             # Update results count
-            total_count = len(processes)
-            filtered_count = len(filtered_processes)
-            
-            if search_term:
-                results_label.config(
-                    text=f"Found {filtered_count} of {total_count} processes matching '{search_term}'",
-                    fg=self.colors['primary']
-                )
-            else:
+            if not search_term:
                 results_label.config(
                     text=f"Showing all {total_count} processes",
                     fg=self.colors['text_light']
                 )
-            
-            # Populate tree with filtered results
-            for idx, proc in enumerate(filtered_processes):
-                tag = 'evenrow' if idx % 2 == 0 else 'oddrow'
-                tree.insert('', tk.END, values=(
-                    proc['pid'],
-                    proc['name'],
-                    format_size(proc['memory_kb'] * 1024)
-                ), tags=(tag,))
-            
-            # Show message if no results
-            if filtered_count == 0 and search_term:
+            elif shown:
+                results_label.config(
+                    text=f"Found {shown} of {total_count} processes matching '{search_term}'",
+                    fg=self.colors['primary']
+                )
+            else:
                 results_label.config(
                     text=f"No processes found matching '{search_term}'",
                     fg=self.colors['danger']
                 )
         
+        search_job = None
+
         def on_search(*args):
-            refresh_list(search_var.get())
-        
+            # Debounce keystrokes: only the trailing edge of a typing burst
+            # triggers a refilter, not every key
+            nonlocal search_job
+            if search_job is not None:
+                self.root.after_cancel(search_job)
+            search_job = self.root.after(150, run_search)
+
+        def run_search():
+            nonlocal search_job
+            search_job = None
+            apply_filter(search_var.get())
+
         # Real-time search as user types
         search_var.trace('w', on_search)
-        
+
         # Search on Enter key
-        search_entry.bind('<Return>', lambda e: refresh_list(search_var.get()))
+        search_entry.bind('<Return>', lambda e: apply_filter(search_var.get()))
         
         # Popular process shortcuts
         shortcut_frame = tk.Frame(dialog, bg=self.colors['white'])
@@ -1159,13 +1390,20 @@ class VirtualMemoryGUI:
             ("Python", "python")
         ]
         
+        # Hover handlers fire on every mouse crossing; bind against local
+        # color names so they don't go through self.colors each event
+        pri = self.colors['primary']
+        white = self.colors['white']
+        light = self.colors['light']
+        dark = self.colors['text_dark']
+
         for label, keyword in shortcuts:
             btn = tk.Button(
                 shortcut_frame,
                 text=label,
                 command=lambda k=keyword: search_var.set(k),
-                bg=self.colors['light'],
-                fg=self.colors['text_dark'],
+                bg=light,
+                fg=dark,
                 font=('Segoe UI', 8),
                 relief=tk.FLAT,
                 padx=8,
@@ -1173,10 +1411,10 @@ class VirtualMemoryGUI:
                 cursor='hand2'
             )
             btn.pack(side=tk.LEFT, padx=2)
-            
+
             # Hover effect
-            btn.bind('<Enter>', lambda e, b=btn: b.config(bg=self.colors['primary'], fg=self.colors['white']))
-            btn.bind('<Leave>', lambda e, b=btn: b.config(bg=self.colors['light'], fg=self.colors['text_dark']))
+            btn.bind('<Enter>', lambda e, b=btn: b.config(bg=pri, fg=white))
+            btn.bind('<Leave>', lambda e, b=btn: b.config(bg=light, fg=dark))
         
         def add_selected():
             selection = tree.selection()
@@ -1189,7 +1427,7 @@ class VirtualMemoryGUI:
                 if process_info:
                     self.vm_manager.add_process(process_info)
                     self._log(f"✅ Added process: {name} (PID: {pid})", 'success')
-                    dialog.destroy()
+                    dialog.withdraw()
                 else:
                     messagebox.showerror("Error", f"Could not add process {name} (PID: {pid})\n\nTry running as Administrator")
             else:
@@ -1219,7 +1457,7 @@ class VirtualMemoryGUI:
         refresh_btn = tk.Button(
             btn_frame,
             text="🔄 Refresh",
-            command=lambda: refresh_list(search_var.get()),
+            command=refresh_list,
             bg=self.colors['primary'],
             fg=self.colors['white'],
             font=('Segoe UI', 11, 'bold'),
@@ -1233,7 +1471,7 @@ class VirtualMemoryGUI:
         cancel_btn = tk.Button(
             btn_frame,
             text="Cancel",
-            command=dialog.destroy,
+            command=dialog.withdraw,
             bg=self.colors['light'],
             fg=self.colors['text_dark'],
             font=('Segoe UI', 11, 'bold'),
@@ -1243,7 +1481,17 @@ class VirtualMemoryGUI:
             cursor='hand2'
         )
         cancel_btn.pack(side=tk.RIGHT)
-        
+
+        def show_dialog():
+            dialog.deiconify()
+            dialog.lift()
+            search_entry.focus()
+            refresh_list()
+
+        # Hide instead of destroy so the next open reuses the widget tree
+        dialog.protocol('WM_DELETE_WINDOW', dialog.withdraw)
+        self._browse_dialog_show = show_dialog
+
         refresh_list()
     
     def _remove_selected_process(self):
@@ -1256,49 +1504,155 @@ class VirtualMemoryGUI:
         item = self.process_tree.item(selection[0])
         pid = int(item['values'][0])
         name = item['values'][1]
-        
-        # Confirm removal
-        result = messagebox.askyesno(
-            "Confirm Removal",
-            f"Remove process from monitoring?\n\nProcess: {name}\nPID: {pid}\n\nThis will free all frames used by this process.",
-            icon='warning'
+
+        # Confirm removal inline; a modal askyesno would stall fault
+        # draining and periodic updates while its nested loop runs
+        self._show_confirm(
+            f"Remove {name} (PID: {pid}) from monitoring? "
+            f"This will free all frames used by this process.",
+            lambda: self._do_remove_process(pid, name)
         )
-        
-        if result:
-            # Remove from both monitor and VM manager
-            self.process_monitor.remove_process_from_tracking(pid)
-            self.vm_manager.remove_process(pid)
-            self._log(f"🗑️ Removed process: {name} (PID: {pid})", 'info')
-            
-            # Update display immediately
-            self._update_displays()
-    
+
+    def _do_remove_process(self, pid: int, name: str):
+        """Remove a process after the inline confirmation"""
+        # Remove from both monitor and VM manager
+        self.process_monitor.remove_process_from_tracking(pid)
+        self.vm_manager.remove_process(pid)
+        self._log(f"🗑️ Removed process: {name} (PID: {pid})", 'info')
+
+        # Defer the redraw to the next idle tick instead of
+        # re-traversing the frame table per removal
+        self._mark_dirty()
+
     def _reset_stats(self):
         """Reset all statistics"""
-        result = messagebox.askyesno(
-            "Reset Statistics",
-            "Are you sure you want to reset all statistics?\n\nThis will clear:\n• Page fault counts\n• Page access counts\n• Recovery time data",
-            icon='question'
+        self._show_confirm(
+            "Reset all statistics? This clears page fault counts, "
+            "access counts and recovery time data.",
+            self._do_reset_stats
         )
-        
-        if result:
-            self.vm_manager.total_page_faults = 0
-            self.vm_manager.total_page_accesses = 0
-            self.vm_manager.fault_recovery_times = []
-            self.vm_manager.algorithm.reset()
-            self._log("🔄 Statistics reset", 'info')
-    
-    def _on_page_fault(self, fault_info: dict):
-        """Handle page fault notification"""
-        log_msg = (f"⚠️  PAGE FAULT | Process: {fault_info['process_name']} (PID: {fault_info['pid']}) | "
-                  f"Page {fault_info['page_num']} → Frame {fault_info['frame_num']} | "
-                  f"Recovery: {fault_info['recovery_time_ms']:.3f} ms | "
-                  f"Total: {fault_info['total_faults']}")
-        
-        # Use root.after to schedule log update instead of calling directly
-        if self.root and self.root.winfo_exists():
-            self.root.after(0, lambda: self._log(log_msg, 'fault'))
-    
+
+    def _do_reset_stats(self):
+        """Reset counters after the inline confirmation"""
+        self.vm_manager.reset_statistics()
+        self.vm_manager.algorithm.reset()
+        self._best_recovery = float('inf')
+        self._worst_recovery = 0.0
+        self._log("🔄 Statistics reset", 'info')
+
+    def _show_confirm(self, message: str, on_confirm):
+        """Show an inline confirmation banner above the main content
+
+        Unlike messagebox.askyesno this doesn't spin a nested event loop,
+        so fault draining and the periodic refresh keep ticking while the
+        question is on screen.
+        """
+        if self._confirm_banner is None:
+            banner = tk.Frame(self.root, bg=self.colors['warning'])
+            self._confirm_banner = banner
+
+            self._confirm_label = tk.Label(
+                banner,
+                text="",
+                font=('Segoe UI', 10),
+                bg=self.colors['warning'],
+                fg=self.colors['dark'],
+                anchor='w',
+                justify=tk.LEFT
+            )
+            self._confirm_label.pack(side=tk.LEFT, padx=15, pady=8,
+                                     fill=tk.X, expand=True)
+
+            no_btn = tk.Button(
+                banner,
+                text="Cancel",
+                command=self._hide_confirm,
+                bg=self.colors['light'],
+                fg=self.colors['text_dark'],
+                font=('Segoe UI', 9, 'bold'),
+                relief=tk.FLAT,
+                padx=12,
+                pady=4,
+                cursor='hand2'
+            )
+            no_btn.pack(side=tk.RIGHT, padx=(5, 15), pady=8)
+
+            yes_btn = tk.Button(
+                banner,
+                text="Confirm",
+                command=self._confirm_accepted,
+                bg=self.colors['danger'],
+                fg=self.colors['white'],
+                font=('Segoe UI', 9, 'bold'),
+                relief=tk.FLAT,
+                padx=12,
+                pady=4,
+                cursor='hand2'
+            )
+            yes_btn.pack(side=tk.RIGHT, pady=8)
+
+        self._confirm_action = on_confirm
+        self._confirm_label.config(text=message)
+        self._confirm_banner.pack(fill=tk.X, before=self._main_container)
+
+    def _hide_confirm(self):
+        """Dismiss the confirmation banner without acting"""
+        self._confirm_action = None
+        if self._confirm_banner is not None:
+            self._confirm_banner.pack_forget()
+
+    def _confirm_accepted(self):
+        """Run the pending confirmation action and hide the banner"""
+        action = self._confirm_action
+        self._hide_confirm()
+        if action:
+            action()
+
+
+    def _on_page_fault(self, fault_info):
+        """Handle page fault notification (a FaultInfo record)"""
+        recovery = fault_info.recovery_time_ms
+        if recovery < self._best_recovery:
+            self._best_recovery = recovery
+        if recovery > self._worst_recovery:
+            self._worst_recovery = recovery
+
+        log_msg = self._FAULT_FMT % (
+            fault_info.process_name, fault_info.pid,
+            fault_info.page_num, fault_info.frame_num,
+            recovery, fault_info.total_faults)
+
+        # Cheap enqueue from the dispatcher thread; the periodic drain on
+        # the Tk thread does the widget work in one batch
+        self._fault_queue.append(log_msg)
+
+    def _drain_faults(self):
+        """Flush queued fault messages to the log in a single insert"""
+        try:
+            if not self.root or not self.root.winfo_exists():
+                return
+
+            if self._fault_queue:
+                timestamp = self._get_timestamp()
+                messages = []
+                while self._fault_queue:
+                    messages.append(self._fault_queue.popleft())
+
+                batched = ''.join(f"[{timestamp}] {msg}\n" for msg in messages)
+                self.log_text.insert(tk.END, batched, 'fault')
+
+                self._log_line_count += len(messages)
+                while self._log_line_count > self._log_max_lines:
+                    self.log_text.delete('1.0', '2.0')
+                    self._log_line_count -= 1
+
+                self.log_text.see(tk.END)
+
+            self.root.after(100, self._drain_faults)
+        except tk.TclError:
+            pass  # Widget destroyed
+
+
     def _log(self, message: str, tag='info'):
         """Add message to log with color coding"""
         try:
@@ -1309,12 +1663,16 @@ class VirtualMemoryGUI:
             full_message = f"[{timestamp}] {message}\n"
             
             self.log_text.insert(tk.END, full_message, tag)
+
+            # Ring-buffer semantics: once at capacity, drop the oldest
+            # line(s) per append — constant work regardless of history
+            # length (messages may themselves span multiple lines)
+            self._log_line_count += full_message.count('\n')
+            while self._log_line_count > self._log_max_lines:
+                self.log_text.delete('1.0', '2.0')
+                self._log_line_count -= 1
+
             self.log_text.see(tk.END)
-            
-            # Keep log size manageable - limit to 500 lines
-            lines = int(self.log_text.index('end-1c').split('.')[0])
-            if lines > 500:
-                self.log_text.delete('1.0', '250.0')  # Delete first half
         except tk.TclError:
             pass  # Widget destroyed
         except Exception as e:
@@ -1322,8 +1680,8 @@ class VirtualMemoryGUI:
     
     def _get_timestamp(self):
         """Get formatted timestamp"""
-        from datetime import datetime
-        return datetime.now().strftime("%H:%M:%S")
+        # time is imported at module scope; no datetime object per log line
+        return time.strftime("%H:%M:%S")
     
     def run(self):
         """Run the GUI"""
@@ -8,6 +8,15 @@ import os
 # Add src directory to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+# If tkthread is available, patch Tk before tkinter is imported so the
+# monitor/simulation threads can touch widgets directly (marshaled via
+# thread::send). Without it, callbacks keep routing through root.after().
+try:
+    import tkthread
+    tkthread.patch()
+except ImportError:
+    pass
+
 from utils import load_config, setup_logging
 from process_monitor import ProcessMonitor
 from virtual_memory import VirtualMemoryManager
@@ -75,7 +84,7 @@ def main():
     finally:
         logger.info("Application shutting down...")
         process_monitor.stop_monitoring()
-        vm_manager.stop_simulation()
+        vm_manager.close()
         logger.info("Cleanup complete")
 
 
@@ -2,18 +2,31 @@
 Page Replacement Algorithms
 Implements FIFO, LRU, Optimal, and LFU algorithms
 """
-from collections import deque, OrderedDict
+from collections import deque
 from typing import List, Tuple, Optional
 import time
 import logging
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Shared result for the common hit case; hits vastly outnumber faults on
+# a warm cache, so returning one immortal tuple avoids an allocation per
+# access
+_PAGE_HIT = (False, None, 0.0)
+
 
 class PageReplacementAlgorithm:
     """Base class for page replacement algorithms"""
     
     def __init__(self, frame_count: int):
         self.frame_count = frame_count
-        self.frames = []
+        # Frame membership lives in a set so hit checks and evictions are
+        # O(1); ordering, where an algorithm needs it, is kept in its own
+        # auxiliary structure (queue, linked list, frequency buckets)
+        self.frame_set = set()
         self.page_faults = 0
         self.page_hits = 0
         self.logger = logging.getLogger(self.__class__.__name__)
@@ -24,10 +37,21 @@ class PageReplacementAlgorithm:
         Returns: (is_page_fault, replaced_page, recovery_time_ms)
         """
         raise NotImplementedError
-    
+
+    def mark_referenced(self, page_number: int):
+        """Record a hit on a page the caller already knows is resident
+
+        Light counterpart to access_page for hit-heavy callers that
+        track residency themselves: no future window, no result tuple.
+        The default only counts the hit, which is all FIFO and Optimal
+        need; algorithms that track recency or frequency override it.
+        """
+        self.page_hits += 1
+
+
     def reset(self):
-        """Reset the algorithm state"""
-        self.frames = []
+        """Reset the algorithm state in place (no reallocation)"""
+        self.frame_set.clear()
         self.page_faults = 0
         self.page_hits = 0
     
@@ -51,197 +75,411 @@ class FIFO(PageReplacementAlgorithm):
         self.queue = deque()
     
     def access_page(self, page_number: int, future_sequence: List[int] = None) -> Tuple[bool, Optional[int], float]:
-        start_time = time.perf_counter()
-        
-        if page_number in self.frames:
+        if page_number in self.frame_set:
             self.page_hits += 1
-            recovery_time = (time.perf_counter() - start_time) * 1000
-            return False, None, recovery_time
-        
-        # Page fault occurred
+            return _PAGE_HIT
+
+        # Page fault occurred; there is no recovery to measure on a hit,
+        # so the clock only starts here
+        start_time = time.perf_counter()
         self.page_faults += 1
         replaced_page = None
-        
-        if len(self.frames) < self.frame_count:
-            self.frames.append(page_number)
+
+        if len(self.queue) < self.frame_count:
+            self.frame_set.add(page_number)
             self.queue.append(page_number)
         else:
             # Replace oldest page (FIFO)
             replaced_page = self.queue.popleft()
-            self.frames.remove(replaced_page)
-            self.frames.append(page_number)
+            self.frame_set.discard(replaced_page)
+            self.frame_set.add(page_number)
             self.queue.append(page_number)
         
         recovery_time = (time.perf_counter() - start_time) * 1000
         return True, replaced_page, recovery_time
-    
+
     def reset(self):
         super().reset()
-        self.queue = deque()
+        self.queue.clear()
+
+
+class _Node:
+    """Intrusive doubly-linked-list node used by LRU"""
+    __slots__ = ('page', 'prev', 'nxt')
+
+    def __init__(self):
+        self.page = None
+        self.prev = None
+        self.nxt = None
 
 
 class LRU(PageReplacementAlgorithm):
-    """Least Recently Used page replacement"""
-    
+    """Least Recently Used page replacement
+
+    Recency order is a hand-rolled doubly-linked list plus a page->node
+    dict: touching or evicting a page is a couple of pointer swaps, with
+    roughly half the memory per resident page of an OrderedDict.
+    """
+
     def __init__(self, frame_count: int):
         super().__init__(frame_count)
-        self.page_order = OrderedDict()
-    
+        self._init_list()
+
+    def _init_list(self):
+        self.page_map = {}
+        # Node pool sized to the frame count up front: warmup never hits
+        # the allocator, and retired nodes go back here instead of the GC
+        self._free_nodes = [_Node() for _ in range(self.frame_count)]
+        # Sentinels: head.nxt is the LRU victim, tail.prev the most recent
+        self.head = _Node()
+        self.tail = _Node()
+        self.head.nxt = self.tail
+        self.tail.prev = self.head
+
+    def _push_recent(self, node):
+        """Insert a node just before the tail sentinel (most recent)"""
+        tail = self.tail
+        node.prev = tail.prev
+        node.nxt = tail
+        tail.prev.nxt = node
+        tail.prev = node
+
     def access_page(self, page_number: int, future_sequence: List[int] = None) -> Tuple[bool, Optional[int], float]:
-        start_time = time.perf_counter()
-        
-        if page_number in self.frames:
+        node = self.page_map.get(page_number)
+        if node is not None:
             self.page_hits += 1
-            # Move to end (most recently used)
-            self.page_order.move_to_end(page_number)
-            recovery_time = (time.perf_counter() - start_time) * 1000
-            return False, None, recovery_time
-        
-        # Page fault occurred
+            # Unlink and reinsert at the most-recently-used end
+            node.prev.nxt = node.nxt
+            node.nxt.prev = node.prev
+            self._push_recent(node)
+            return _PAGE_HIT
+
+        # Page fault occurred; timing covers only the fault path
+        start_time = time.perf_counter()
         self.page_faults += 1
         replaced_page = None
-        
-        if len(self.frames) < self.frame_count:
-            self.frames.append(page_number)
-            self.page_order[page_number] = True
-        else:
+
+        if len(self.page_map) >= self.frame_count:
             # Replace least recently used page
-            lru_page = next(iter(self.page_order))
-            replaced_page = lru_page
-            self.frames.remove(lru_page)
-            del self.page_order[lru_page]
-            self.frames.append(page_number)
-            self.page_order[page_number] = True
-        
+            victim = self.head.nxt
+            self.head.nxt = victim.nxt
+            victim.nxt.prev = self.head
+            replaced_page = victim.page
+            del self.page_map[replaced_page]
+            self._free_nodes.append(victim)
+
+        node = self._free_nodes.pop() if self._free_nodes else _Node()
+        node.page = page_number
+        self.page_map[page_number] = node
+        self._push_recent(node)
+
         recovery_time = (time.perf_counter() - start_time) * 1000
         return True, replaced_page, recovery_time
-    
+
+    def mark_referenced(self, page_number: int):
+        self.page_hits += 1
+        node = self.page_map.get(page_number)
+        if node is not None:
+            node.prev.nxt = node.nxt
+            node.nxt.prev = node.prev
+            self._push_recent(node)
+
     def reset(self):
         super().reset()
-        self.page_order = OrderedDict()
+        # Recycle live nodes into the pool and relink the sentinels
+        node = self.head.nxt
+        while node is not self.tail:
+            self._free_nodes.append(node)
+            node = node.nxt
+        self.page_map.clear()
+        self.head.nxt = self.tail
+        self.tail.prev = self.head
+
+
+def precompute_next_use(trace: List[int]) -> List[int]:
+    """Belady preprocessing: next_use[i] = index of the next occurrence
+    of trace[i], or len(trace) if the page never recurs.
+
+    Built in one reverse pass, so replaying a trace through Optimal with
+    position/next_use costs O(frames) per fault instead of re-scanning
+    the future sequence on every access.
+    """
+    n = len(trace)
+    next_use = np.empty(n, dtype=np.int64) if np is not None else [0] * n
+    last_seen = {}
+
+    for i in range(n - 1, -1, -1):
+        page = trace[i]
+        next_use[i] = last_seen.get(page, n)
+        last_seen[page] = i
+
+    return next_use
 
 
 class Optimal(PageReplacementAlgorithm):
     """Optimal page replacement (requires future knowledge)"""
-    
-    def access_page(self, page_number: int, future_sequence: List[int] = None) -> Tuple[bool, Optional[int], float]:
-        start_time = time.perf_counter()
-        
-        if page_number in self.frames:
+
+    def __init__(self, frame_count: int):
+        super().__init__(frame_count)
+        # Next-use index per resident page, maintained when the caller
+        # replays a trace with a precomputed next_use array
+        self._next_use_of = {}
+
+    def access_page(self, page_number: int, future_sequence: List[int] = None,
+                    position: int = None, next_use=None) -> Tuple[bool, Optional[int], float]:
+        if next_use is not None and position is not None:
+            self._next_use_of[page_number] = next_use[position]
+
+        if page_number in self.frame_set:
             self.page_hits += 1
-            recovery_time = (time.perf_counter() - start_time) * 1000
-            return False, None, recovery_time
-        
-        # Page fault occurred
+            return _PAGE_HIT
+
+        # Page fault occurred; timing covers only the fault path
+        start_time = time.perf_counter()
         self.page_faults += 1
         replaced_page = None
-        
-        if len(self.frames) < self.frame_count:
-            self.frames.append(page_number)
+
+        if len(self.frame_set) < self.frame_count:
+            self.frame_set.add(page_number)
         else:
             # Replace page that won't be used for longest time
-            if future_sequence:
-                farthest_use = -1
-                page_to_replace = self.frames[0]
-                
-                for page in self.frames:
-                    try:
-                        next_use = future_sequence.index(page)
-                    except ValueError:
-                        # Page not in future sequence, replace it
-                        page_to_replace = page
-                        break
-                    
-                    if next_use > farthest_use:
-                        farthest_use = next_use
-                        page_to_replace = page
-                
-                replaced_page = page_to_replace
-                self.frames.remove(page_to_replace)
+            if next_use is not None and position is not None:
+                # Precomputed Belady path: every resident page carries its
+                # next-use index, so the victim is a plain max over frames
+                nu = self._next_use_of
+                replaced_page = max(self.frame_set, key=nu.__getitem__)
+                del nu[replaced_page]
+                self.frame_set.discard(replaced_page)
+            elif future_sequence is not None and len(future_sequence):
+                replaced_page = self._find_victim(future_sequence)
+                self.frame_set.discard(replaced_page)
             else:
-                # Fallback to FIFO if no future sequence
-                replaced_page = self.frames[0]
-                self.frames.pop(0)
-            
-            self.frames.append(page_number)
-        
+                # Fallback to an arbitrary victim if no future sequence
+                replaced_page = next(iter(self.frame_set))
+                self.frame_set.discard(replaced_page)
+
+            self.frame_set.add(page_number)
+
         recovery_time = (time.perf_counter() - start_time) * 1000
         return True, replaced_page, recovery_time
 
+    def reset(self):
+        super().reset()
+        self._next_use_of.clear()
+
+    def _find_victim(self, future_sequence: List[int]) -> int:
+        """Pick the resident page whose next use is farthest in the future"""
+        if np is not None:
+            # One vectorized pass over (frames x future) instead of a
+            # Python loop calling list.index() per resident page
+            future = np.asarray(future_sequence, dtype=np.int64)
+            frames_arr = np.fromiter(self.frame_set, dtype=np.int64,
+                                     count=len(self.frame_set))
+            mask = frames_arr[:, None] == future[None, :]
+            used_again = mask.any(1)
+            if not used_again.all():
+                # Some resident page never recurs; evict one of those
+                return int(frames_arr[int(np.argmin(used_again))])
+            return int(frames_arr[int(mask.argmax(1).argmax())])
+
+        # Pure-Python fallback when numpy isn't installed: one pass over
+        # the future, recording each resident page's first occurrence and
+        # stopping as soon as every frame has been located
+        frame_set = self.frame_set
+        seen = {}
+        for i, page in enumerate(future_sequence):
+            if page in frame_set and page not in seen:
+                seen[page] = i
+                if len(seen) == len(frame_set):
+                    break
+
+        if len(seen) < len(frame_set):
+            # Some resident page never recurs; evict one of those
+            for page in frame_set:
+                if page not in seen:
+                    return page
+
+        return max(seen, key=seen.get)
+
 
 class LFU(PageReplacementAlgorithm):
-    """Least Frequently Used page replacement"""
-    
+    """Least Frequently Used page replacement
+
+    Pages are grouped into per-frequency buckets (oldest first within a
+    bucket), so eviction pops the head of the minimum-frequency bucket in
+    O(1) instead of scanning every resident frame for the minimum.
+    """
+
     def __init__(self, frame_count: int):
         super().__init__(frame_count)
-        self.frequency = {}
-        self.time_counter = 0
-        self.last_used = {}
-    
+        self._init_buckets()
+
+    def _init_buckets(self):
+        self.freq_of = {}   # page -> access frequency
+        # frequency -> dict of pages, oldest first (plain dicts keep
+        # insertion order and cost about half an OrderedDict)
+        self.buckets = {}
+        self.min_freq = 0
+
+    def _touch(self, page_number: int):
+        """Move a resident page up one frequency bucket"""
+        freq = self.freq_of[page_number]
+        bucket = self.buckets[freq]
+        del bucket[page_number]
+        if not bucket:
+            del self.buckets[freq]
+            if self.min_freq == freq:
+                self.min_freq = freq + 1
+        next_freq = freq + 1
+        self.freq_of[page_number] = next_freq
+        # get() instead of setdefault(): setdefault would allocate a
+        # throwaway dict on every hit whose target bucket already exists
+        next_bucket = self.buckets.get(next_freq)
+        if next_bucket is None:
+            next_bucket = self.buckets[next_freq] = {}
+        next_bucket[page_number] = None
+
     def access_page(self, page_number: int, future_sequence: List[int] = None) -> Tuple[bool, Optional[int], float]:
+        if page_number in self.freq_of:
+            self.page_hits += 1
+            self._touch(page_number)
+            return _PAGE_HIT
+
+        # Page fault occurred; timing covers only the fault path
         start_time = time.perf_counter()
-        self.time_counter += 1
-        
-        if page_number in self.frames:
+        self.page_faults += 1
+        replaced_page = None
+
+        if len(self.freq_of) >= self.frame_count:
+            # Replace least frequently used page (oldest in its bucket
+            # as the tiebreaker)
+            bucket = self.buckets[self.min_freq]
+            replaced_page = next(iter(bucket))
+            del bucket[replaced_page]
+            if not bucket:
+                del self.buckets[self.min_freq]
+            del self.freq_of[replaced_page]
+            self.frame_set.discard(replaced_page)
+
+        self.frame_set.add(page_number)
+        self.freq_of[page_number] = 1
+        bucket_one = self.buckets.get(1)
+        if bucket_one is None:
+            bucket_one = self.buckets[1] = {}
+        bucket_one[page_number] = None
+        self.min_freq = 1
+
+        recovery_time = (time.perf_counter() - start_time) * 1000
+        return True, replaced_page, recovery_time
+
+    def mark_referenced(self, page_number: int):
+        self.page_hits += 1
+        if page_number in self.freq_of:
+            self._touch(page_number)
+
+    def reset(self):
+        super().reset()
+        self.freq_of.clear()
+        self.buckets.clear()
+        self.min_freq = 0
+
+
+class Clock(PageReplacementAlgorithm):
+    """Clock (second-chance) page replacement
+
+    Resident pages sit in a fixed ring with one reference bit each. A
+    hit just sets the bit -- nothing moves -- and eviction sweeps the
+    hand forward, clearing bits until it lands on an unreferenced page.
+    """
+
+    def __init__(self, frame_count: int):
+        super().__init__(frame_count)
+        self._ring = []      # resident pages in frame order
+        self._ref_bit = {}   # page -> referenced since last sweep
+        self._hand = 0
+
+    def access_page(self, page_number: int, future_sequence: List[int] = None) -> Tuple[bool, Optional[int], float]:
+        if page_number in self.frame_set:
             self.page_hits += 1
-            self.frequency[page_number] = self.frequency.get(page_number, 0) + 1
-            self.last_used[page_number] = self.time_counter
-            recovery_time = (time.perf_counter() - start_time) * 1000
-            return False, None, recovery_time
-        
-        # Page fault occurred
+            self._ref_bit[page_number] = True
+            return _PAGE_HIT
+
+        # Page fault occurred; timing covers only the fault path
+        start_time = time.perf_counter()
         self.page_faults += 1
         replaced_page = None
-        
-        if len(self.frames) < self.frame_count:
-            self.frames.append(page_number)
+
+        if len(self._ring) < self.frame_count:
+            self._ring.append(page_number)
         else:
-            # Replace least frequently used page (with LRU as tiebreaker)
-            min_freq = float('inf')
-            lfu_page = None
-            oldest_time = float('inf')
-            
-            for page in self.frames:
-                freq = self.frequency.get(page, 0)
-                last_time = self.last_used.get(page, 0)
-                
-                if freq < min_freq or (freq == min_freq and last_time < oldest_time):
-                    min_freq = freq
-                    lfu_page = page
-                    oldest_time = last_time
-            
-            replaced_page = lfu_page
-            self.frames.remove(lfu_page)
-            if lfu_page in self.frequency:
-                del self.frequency[lfu_page]
-            if lfu_page in self.last_used:
-                del self.last_used[lfu_page]
-            
-            self.frames.append(page_number)
-        
-        self.frequency[page_number] = self.frequency.get(page_number, 0) + 1
-        self.last_used[page_number] = self.time_counter
-        
+            # Sweep past referenced pages, stripping their second chance
+            ring = self._ring
+            ref_bit = self._ref_bit
+            hand = self._hand
+            while ref_bit[ring[hand]]:
+                ref_bit[ring[hand]] = False
+                hand = (hand + 1) % len(ring)
+
+            replaced_page = ring[hand]
+            del ref_bit[replaced_page]
+            self.frame_set.discard(replaced_page)
+            ring[hand] = page_number
+            self._hand = (hand + 1) % len(ring)
+
+        self.frame_set.add(page_number)
+        # Loaded pages start referenced: the faulting access counts
+        self._ref_bit[page_number] = True
+
         recovery_time = (time.perf_counter() - start_time) * 1000
         return True, replaced_page, recovery_time
-    
+
+    def mark_referenced(self, page_number: int):
+        self.page_hits += 1
+        if page_number in self.frame_set:
+            self._ref_bit[page_number] = True
+
     def reset(self):
         super().reset()
-        self.frequency = {}
-        self.time_counter = 0
-        self.last_used = {}
+        self._ring.clear()
+        self._ref_bit.clear()
+        self._hand = 0
+
+
+# Registry shared by the factory and callers validating user input
+ALGORITHMS = {
+    'FIFO': FIFO,
+    'LRU': LRU,
+    'Optimal': Optimal,
+    'LFU': LFU,
+    'Clock': Clock
+}
 
 
 def get_algorithm(algorithm_name: str, frame_count: int) -> PageReplacementAlgorithm:
     """Factory function to get page replacement algorithm"""
-    algorithms = {
-        'FIFO': FIFO,
-        'LRU': LRU,
-        'Optimal': Optimal,
-        'LFU': LFU
-    }
-    
-    if algorithm_name not in algorithms:
+    if algorithm_name not in ALGORITHMS:
         raise ValueError(f"Unknown algorithm: {algorithm_name}")
-    
-    return algorithms[algorithm_name](frame_count)
\ No newline at end of file
+
+    return ALGORITHMS[algorithm_name](frame_count)
+
+
+def simulate(algorithm_name: str, trace: List[int], frame_count: int) -> dict:
+    """Replay a whole trace through an algorithm in one call
+
+    Batch counterpart to per-access access_page(): one bound-method loop
+    with no per-access timing consumption, and Optimal runs against the
+    precomputed Belady next-use array instead of re-scanning the future
+    per fault. Returns the algorithm's stats dict.
+    """
+    algorithm = get_algorithm(algorithm_name, frame_count)
+    access = algorithm.access_page
+
+    if isinstance(algorithm, Optimal):
+        next_use = precompute_next_use(trace)
+        for position, page in enumerate(trace):
+            access(page, position=position, next_use=next_use)
+    else:
+        for page in trace:
+            access(page)
+
+    return algorithm.get_stats()
\ No newline at end of file
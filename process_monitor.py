@@ -2,6 +2,7 @@
 Process Monitor for Windows
 Monitors real processes and their memory usage
 """
+import os
 import psutil
 import threading
 import time
@@ -12,13 +13,20 @@ import logging
 
 class ProcessMonitor:
     """Monitor Windows processes and their memory usage"""
-    
+
+    # Above this many tracked PIDs, a single process_iter scan is cheaper
+    # than one memory_info syscall per PID
+    _BATCH_THRESHOLD = 8
+
     def __init__(self, callback: Callable = None, interval: float = 1.0):
         self.callback = callback
         self.interval = interval
         self.running = False
         self.monitor_thread = None
         self.tracked_processes: Dict[int, ProcessInfo] = {}
+        # psutil.Process handles are reused across monitor ticks instead
+        # of re-opened per iteration
+        self._proc_cache: Dict[int, psutil.Process] = {}
         self.logger = logging.getLogger("ProcessMonitor")
         self.process_filter = set()  # PIDs to specifically track
         
@@ -52,21 +60,23 @@ class ProcessMonitor:
             
             self.process_filter.add(pid)
             self.tracked_processes[pid] = proc_info
+            self._proc_cache[pid] = process
             
             if self.callback:
                 self.callback('new_process', proc_info)
             
-            self.logger.info(f"Now tracking process: {proc_info}")
+            self.logger.info("Now tracking process: %s", proc_info)
             return proc_info
             
         except (psutil.NoSuchProcess, psutil.AccessDenied) as e:
-            self.logger.error(f"Cannot track process {pid}: {e}")
+            self.logger.error("Cannot track process %d: %s", pid, e)
             return None
     
     def remove_process_from_tracking(self, pid: int):
         """Remove a process from tracking"""
         if pid in self.process_filter:
             self.process_filter.remove(pid)
+        self._proc_cache.pop(pid, None)
         if pid in self.tracked_processes:
             del self.tracked_processes[pid]
             if self.callback:
@@ -78,10 +88,16 @@ class ProcessMonitor:
         for proc in psutil.process_iter(['pid', 'name', 'memory_info']):
             try:
                 info = proc.info
+                name = info['name']
+                pid = info['pid']
                 processes.append({
-                    'pid': info['pid'],
-                    'name': info['name'],
-                    'memory_kb': info['memory_info'].rss // 1024
+                    'pid': pid,
+                    'name': name,
+                    'memory_kb': info['memory_info'].rss // 1024,
+                    # Precomputed search keys so callers filtering per
+                    # keystroke don't re-lowercase every name each time
+                    '_name_lower': name.lower(),
+                    '_pid_str': str(pid)
                 })
             except (psutil.NoSuchProcess, psutil.AccessDenied):
                 pass
@@ -102,15 +118,27 @@ class ProcessMonitor:
                 
                 # Check if tracked processes are still running
                 pids_to_check = list(self.tracked_processes.keys())
-                
+
+                # With many tracked PIDs one batched table scan holds the
+                # GIL for a single pass instead of N per-PID round trips
+                if len(pids_to_check) > self._BATCH_THRESHOLD:
+                    self._poll_batched()
+                    consecutive_errors = 0
+                    continue
+
                 for pid in pids_to_check:
                     try:
                         if not psutil.pid_exists(pid):
-                            self.logger.info(f"Process {pid} terminated")
+                            self.logger.info("Process %d terminated", pid)
                             self.remove_process_from_tracking(pid)
                         else:
-                            # Update memory usage (less frequently)
-                            process = psutil.Process(pid)
+                            # Update memory usage via the cached handle;
+                            # reconstructing psutil.Process re-opens OS
+                            # handles every tick
+                            process = self._proc_cache.get(pid)
+                            if process is None:
+                                process = psutil.Process(pid)
+                                self._proc_cache[pid] = process
                             memory_kb = process.memory_info().rss // 1024
                             
                             if pid in self.tracked_processes:
@@ -123,16 +151,16 @@ class ProcessMonitor:
                                         try:
                                             self.callback('memory_change', self.tracked_processes[pid])
                                         except Exception as e:
-                                            self.logger.error(f"Callback error: {e}")
+                                            self.logger.error("Callback error: %s", e)
                     except (psutil.NoSuchProcess, psutil.AccessDenied) as e:
                         pass
                     except Exception as e:
-                        self.logger.error(f"Error checking process {pid}: {e}")
+                        self.logger.error("Error checking process %d: %s", pid, e)
                 
                 consecutive_errors = 0  # Reset on successful iteration
                 
             except Exception as e:
-                self.logger.error(f"Error in monitoring loop: {e}")
+                self.logger.error("Error in monitoring loop: %s", e)
                 consecutive_errors += 1
                 if consecutive_errors >= max_errors:
                     self.logger.error("Too many consecutive errors, stopping monitor")
@@ -141,18 +169,64 @@ class ProcessMonitor:
                 time.sleep(2)  # Wait longer before retrying
         
         self.logger.info("Process monitoring stopped")
-    
+
+    def _poll_batched(self):
+        """Refresh every tracked process from one process-table scan"""
+        tracked = self.tracked_processes
+        seen = set()
+
+        for proc in psutil.process_iter(['pid', 'memory_info']):
+            pid = proc.info['pid']
+            if pid not in tracked:
+                continue
+            seen.add(pid)
+
+            # process_iter leaves memory_info as None when the process is
+            # a zombie or access is denied; the process still exists, so
+            # keep it tracked and just skip this sample
+            mem = proc.info['memory_info']
+            if mem is None:
+                continue
+
+            memory_kb = mem.rss // 1024
+            old_memory = tracked[pid].memory_kb
+            tracked[pid].memory_kb = memory_kb
+
+            # Notify if significant memory change (5MB threshold)
+            if abs(memory_kb - old_memory) > 5120 and self.callback:
+                try:
+                    self.callback('memory_change', tracked[pid])
+                except Exception as e:
+                    self.logger.error("Callback error: %s", e)
+
+        # Anything tracked but absent from the scan has terminated
+        for pid in list(tracked):
+            if pid not in seen:
+                self.logger.info("Process %d terminated", pid)
+                self.remove_process_from_tracking(pid)
+
     def get_process_by_name(self, name: str) -> List[Dict]:
         """Find processes by name"""
+        # Pass 1 only fetches pid/name, which is cheap; memory_info is an
+        # extra syscall per process and is deferred to the (small) set of
+        # name matches
+        name_lower = name.lower()
+        candidates = []
+        for proc in psutil.process_iter(['pid', 'name']):
+            try:
+                if name_lower in proc.info['name'].lower():
+                    candidates.append(proc)
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                pass
+
         matching = []
-        for proc in psutil.process_iter(['pid', 'name', 'memory_info']):
+        for proc in candidates:
             try:
-                if name.lower() in proc.info['name'].lower():
-                    matching.append({
-                        'pid': proc.info['pid'],
-                        'name': proc.info['name'],
-                        'memory_kb': proc.info['memory_info'].rss // 1024
-                    })
+                matching.append({
+                    'pid': proc.info['pid'],
+                    'name': proc.info['name'],
+                    'memory_kb': proc.memory_info().rss // 1024
+                })
             except (psutil.NoSuchProcess, psutil.AccessDenied):
                 pass
         return matching
@@ -160,5 +234,5 @@ class ProcessMonitor:
     def get_file_processes(self, filepath: str) -> List[Dict]:
         """Get processes associated with a file"""
         # This is a simplified version - in reality, would need to check open files
-        filename = filepath.split('\\')[-1].split('.')[0]
+        filename = os.path.splitext(os.path.basename(filepath))[0]
         return self.get_process_by_name(filename)
\ No newline at end of file
@@ -4,6 +4,7 @@ Utility functions for Virtual Memory Manager
 import json
 import logging
 import os
+from array import array
 from datetime import datetime
 from typing import Dict, Any
 
@@ -65,13 +66,23 @@ def get_timestamp() -> str:
 
 class ProcessInfo:
     """Class to store process information"""
+    # One instance per tracked process; slots drop the per-instance dict
+    __slots__ = ('pid', 'name', 'memory_kb', 'pages_needed',
+                 'loaded_pages', 'page_sequence', 'page_cursor',
+                 'creation_time')
+
     def __init__(self, pid: int, name: str, memory_kb: int):
         self.pid = pid
         self.name = name
         self.memory_kb = memory_kb
         self.pages_needed = 0
         self.loaded_pages = set()
-        self.page_sequence = []
+        # Unsigned 32-bit array: 4 bytes per page number instead of a
+        # boxed Python int per entry. The VM manager replaces this with a
+        # numpy int32 array and walks it via page_cursor instead of
+        # rotating the sequence
+        self.page_sequence = array('I')
+        self.page_cursor = 0
         self.creation_time = datetime.now()
         
     def __repr__(self):
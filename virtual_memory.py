@@ -2,18 +2,50 @@
 Virtual Memory Manager
 Manages virtual memory allocation and page replacement
 """
+import json
+import queue
 import random
 import threading
 import time
+from collections import deque, namedtuple
+
+import numpy as np
 from typing import Dict, List, Tuple, Optional
 from utils import ProcessInfo, calculate_pages
-from page_replacement import get_algorithm, PageReplacementAlgorithm
+from page_replacement import get_algorithm, PageReplacementAlgorithm, simulate as simulate_trace
 import logging
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dump_json(obj) -> bytes:
+    """Serialize to compact JSON bytes, via orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+
+# Fault notification record: one flat allocation instead of an
+# eight-key dict per fault, with attribute access for consumers
+FaultInfo = namedtuple('FaultInfo', (
+    'pid', 'process_name', 'page_num', 'frame_num',
+    'replaced_page', 'recovery_time_ms', 'total_faults', 'fault_rate'
+))
+
 
 class VirtualMemoryManager:
     """Manages virtual memory for processes"""
-    
+
+    # Fault notifications queued beyond this are dropped rather than
+    # letting a stalled consumer grow the queue without bound
+    _FAULT_Q_LIMIT = 1024
+
+    # Queued sentinel telling the fault dispatcher to exit
+    _FAULT_Q_STOP = object()
+
     def __init__(self, page_size_kb: int, frame_count: int, algorithm_name: str):
         self.page_size_kb = page_size_kb
         self.frame_count = frame_count
@@ -21,20 +53,99 @@ class VirtualMemoryManager:
         self.algorithm = get_algorithm(algorithm_name, frame_count)
         
         self.processes: Dict[int, ProcessInfo] = {}
-        self.page_table: Dict[int, Dict[int, Optional[int]]] = {}  # pid -> {page_num -> frame_num}
-        self.frame_table: List[Optional[Tuple[int, int]]] = [None] * frame_count  # frame -> (pid, page_num)
+        # pid -> int32 array indexed by page number; the value is the
+        # frame holding that page, or -1 when it isn't resident. An
+        # array slot costs 4 bytes vs ~100 for a dict entry of boxed ints
+        self.page_table: Dict[int, np.ndarray] = {}
+        # Frame table as two parallel int32 arrays (-1 = empty) instead
+        # of a list of (pid, page) tuples; counting used frames becomes
+        # a vectorized comparison and each slot costs 8 bytes
+        self._frame_pid = np.full(frame_count, -1, dtype=np.int32)
+        self._frame_page = np.full(frame_count, -1, dtype=np.int32)
+        # Occupied-frame count maintained incrementally by the writers
+        # so statistics never have to count the array
+        self._frames_used = 0
+        # Auxiliary indexes so _allocate_frame never scans the frame arrays:
+        # a free list for empty frames and a page -> frame reverse map
+        # (pages are global to the replacement algorithm, so the key is
+        # the page number, matching what access_page reports as evicted)
+        self._free_frames = deque(range(frame_count))
+        self._page_to_frame: Dict[int, int] = {}
+        # Serialized frame snapshot for HTTP pollers; the frame table
+        # changes at most once per tick, so the bytes are rebuilt only
+        # when something actually moved
+        self._viz_cache: Optional[bytes] = None
+        self._viz_dirty = True
         
         self.logger = logging.getLogger("VirtualMemoryManager")
+        # Private RNG (no contention on the random module's global
+        # instance) and a precomputed block of pids to simulate, refilled
+        # every 64 ticks instead of re-sampled every tick
+        self._rng = random.Random()
+        # Maintained copy of the tracked pids so the tick never rebuilds
+        # list(self.processes.keys())
+        self._pid_list: List[int] = []
+        self._pid_batch: List[int] = []
+        self._pid_batch_i = 0
         self.running = False
         self.simulation_thread = None
-        self.page_fault_callback = None
-        
+        # Interruptible tick timer: the loop waits on this event instead
+        # of sleeping, so stop_simulation takes effect mid-wait
+        self._stop_event = threading.Event()
+        self._tick_interval = 0.25  # Even slower simulation for less CPU
+        # Pull-model bookkeeping for tick_to()
+        self._last_tick = time.monotonic()
+        # Fault notifications are queued here and delivered by a
+        # dedicated dispatcher thread, so a slow callback (GUI work,
+        # websocket emit, ...) never stalls the simulation tick or
+        # lengthens its critical section. Bounded by _FAULT_Q_LIMIT:
+        # overflow drops the notification, never blocks the tick. The
+        # thread starts lazily on first callback registration, so
+        # managers that never register one never cost a thread
+        self._fault_q = queue.SimpleQueue()
+        self._fault_dispatcher = None
+        self._page_fault_callback = None
+
         self.total_page_faults = 0
         self.total_page_accesses = 0
-        self.fault_recovery_times = []
-        
+        # Recent recovery times in a preallocated float32 ring buffer
+        # with a running sum: O(1) append, O(1) average, no allocations
+        self._rec_buf = np.zeros(8192, dtype=np.float32)
+        self._rec_head = 0
+        self._rec_count = 0
+        self._rec_sum = 0.0
+
+        # lock guards the structural state (page/frame tables, processes,
+        # algorithm); _stats_lock guards only the counters above so
+        # readers polling statistics never wait on a simulation tick.
+        # Lock order where both are held: lock first, then _stats_lock
         self.lock = threading.Lock()
-    
+        self._stats_lock = threading.Lock()
+
+        # Access path specialized for the current algorithm; rebuilt by
+        # change_algorithm/change_frames
+        self._access_page = self._make_access_page()
+
+    @property
+    def page_fault_callback(self):
+        return self._page_fault_callback
+
+    @page_fault_callback.setter
+    def page_fault_callback(self, callback):
+        self._page_fault_callback = callback
+        if callback is not None and self._fault_dispatcher is None:
+            self._fault_dispatcher = threading.Thread(
+                target=self._dispatch_faults, daemon=True)
+            self._fault_dispatcher.start()
+
+    def close(self):
+        """Stop the simulation and release the dispatcher thread"""
+        self.stop_simulation()
+        if self._fault_dispatcher is not None:
+            self._fault_q.put_nowait(self._FAULT_Q_STOP)
+            self._fault_dispatcher.join(timeout=1)
+            self._fault_dispatcher = None
+
     def add_process(self, process_info: ProcessInfo):
         """Add a process to virtual memory management"""
         with self.lock:
@@ -45,12 +156,16 @@ class VirtualMemoryManager:
             process_info.pages_needed = pages_needed
             
             # Initialize page table for process
-            self.page_table[pid] = {page_num: None for page_num in range(pages_needed)}
+            self.page_table[pid] = np.full(pages_needed, -1, dtype=np.int32)
             self.processes[pid] = process_info
             
             # Generate simulated page access sequence
             process_info.page_sequence = self._generate_page_sequence(pages_needed)
-            
+
+            # Force a pid-batch refill so the new process is picked up
+            self._pid_list.append(pid)
+            self._pid_batch_i = len(self._pid_batch)
+
             self.logger.info(f"Added process {pid} ({process_info.name}) - "
                            f"{process_info.memory_kb}KB, {pages_needed} pages")
     
@@ -58,14 +173,27 @@ class VirtualMemoryManager:
         """Remove a process from virtual memory management"""
         with self.lock:
             if pid in self.processes:
-                # Free frames occupied by this process
-                for frame_idx, frame_content in enumerate(self.frame_table):
-                    if frame_content and frame_content[0] == pid:
-                        self.frame_table[frame_idx] = None
-                
+                # Free frames occupied by this process; the page table
+                # already knows which frames they are, no scan needed
+                page_map = self.page_table[pid]
+                for page_num in np.nonzero(page_map != -1)[0]:
+                    frame_idx = int(page_map[page_num])
+                    self._frame_pid[frame_idx] = -1
+                    self._frame_page[frame_idx] = -1
+                    self._free_frames.append(frame_idx)
+                    self._frames_used -= 1
+                    if self._page_to_frame.get(int(page_num)) == frame_idx:
+                        del self._page_to_frame[int(page_num)]
+                self._viz_dirty = True
+
                 # Remove from tracking
                 del self.processes[pid]
                 del self.page_table[pid]
+
+                # Invalidate the pid batch; stale entries for this pid
+                # would just burn ticks on the .get miss
+                self._pid_list.remove(pid)
+                self._pid_batch_i = len(self._pid_batch)
                 
                 self.logger.info(f"Removed process {pid}")
     
@@ -77,11 +205,16 @@ class VirtualMemoryManager:
             self.algorithm.reset()
             
             # Clear all frame allocations
-            self.frame_table = [None] * self.frame_count
-            for pid in self.page_table:
-                for page_num in self.page_table[pid]:
-                    self.page_table[pid][page_num] = None
-            
+            self._frame_pid.fill(-1)
+            self._frame_page.fill(-1)
+            self._free_frames = deque(range(self.frame_count))
+            self._page_to_frame.clear()
+            self._frames_used = 0
+            self._viz_dirty = True
+            for page_map in self.page_table.values():
+                page_map.fill(-1)  # single memset per process
+
+            self._access_page = self._make_access_page()
             self.logger.info(f"Changed algorithm to {algorithm_name}")
     
     def change_frames(self, new_frame_count: int):
@@ -90,239 +223,364 @@ class VirtualMemoryManager:
             self.frame_count = new_frame_count
             self.algorithm = get_algorithm(self.algorithm_name, new_frame_count)
             
-            # Adjust frame table
-            if new_frame_count > len(self.frame_table):
-                self.frame_table.extend([None] * (new_frame_count - len(self.frame_table)))
-            else:
-                self.frame_table = self.frame_table[:new_frame_count]
-            
+            # Adjust frame table, preserving the overlapping slots
+            old_pid, old_page = self._frame_pid, self._frame_page
+            self._frame_pid = np.full(new_frame_count, -1, dtype=np.int32)
+            self._frame_page = np.full(new_frame_count, -1, dtype=np.int32)
+            keep = min(new_frame_count, len(old_pid))
+            self._frame_pid[:keep] = old_pid[:keep]
+            self._frame_page[:keep] = old_page[:keep]
+
+            # Rebuild the auxiliary indexes from the adjusted table
+            empty = self._frame_pid == -1
+            self._free_frames = deque(np.nonzero(empty)[0].tolist())
+            self._page_to_frame = {
+                int(self._frame_page[idx]): int(idx)
+                for idx in np.nonzero(~empty)[0]
+            }
+            self._frames_used = int(np.count_nonzero(~empty))
+            self._viz_dirty = True
+
+            # Drop page-table mappings to frames that no longer exist
+            for page_map in self.page_table.values():
+                page_map[page_map >= new_frame_count] = -1
+
+            self._access_page = self._make_access_page()
             self.logger.info(f"Changed frame count to {new_frame_count}")
     
+    def set_tick_rate(self, ticks_per_second: float):
+        """Set how many page accesses are simulated per second"""
+        if ticks_per_second <= 0:
+            raise ValueError("ticks_per_second must be positive")
+        self._tick_interval = 1.0 / ticks_per_second
+        self.logger.info(f"Tick rate set to {ticks_per_second}/s")
+
     def start_simulation(self):
         """Start simulating page accesses"""
         if not self.running:
             self.running = True
+            self._stop_event.clear()
             self.simulation_thread = threading.Thread(target=self._simulation_loop, daemon=True)
             self.simulation_thread.start()
             self.logger.info("Memory simulation started")
-    
+
     def stop_simulation(self):
         """Stop simulating page accesses"""
         self.running = False
+        self._stop_event.set()
         if self.simulation_thread and self.simulation_thread.is_alive():
             self.simulation_thread.join(timeout=3)
+        # Pull-model callers resume from now, not from thread start
+        self._last_tick = time.monotonic()
         self.logger.info("Memory simulation stopped")
-    
+
     def _simulation_loop(self):
         """Main simulation loop that simulates page accesses"""
         consecutive_errors = 0
         max_errors = 5
-        sleep_time = 0.25  # Even slower simulation for less CPU
-        
-        while self.running:
+
+        # wait() doubles as the tick timer and the stop signal: it
+        # returns True the moment stop_simulation sets the event, so
+        # shutdown doesn't ride out the remainder of a sleep
+        while not self._stop_event.wait(self._tick_interval):
             try:
-                time.sleep(sleep_time)
-                
                 # Quick check without lock first
                 if not self.processes:
                     consecutive_errors = 0
                     continue
-                
-                # Minimal lock time
-                pid = None
-                page_num = None
-                page_sequence = None
-                
-                with self.lock:
-                    # Quick operations only inside lock
-                    try:
-                        pids = list(self.processes.keys())
-                        if not pids:
-                            continue
-                            
-                        pid = random.choice(pids)
-                        process = self.processes.get(pid)
-                        
-                        if not process or not process.page_sequence:
-                            continue
-                        
-                        # Get data we need
-                        page_num = process.page_sequence[0]
-                        page_sequence = process.page_sequence[:50]  # Copy only what we need
-                        
-                        # Rotate sequence
-                        process.page_sequence = process.page_sequence[1:] + [page_num]
-                        
-                    except (KeyError, IndexError, AttributeError):
-                        consecutive_errors += 1
-                        if consecutive_errors >= max_errors:
-                            self.logger.error("Too many consecutive errors, stopping simulation")
-                            self.running = False
-                            break
-                        continue
-                
-                # Do the heavy work outside the lock
-                if pid and page_num is not None:
-                    try:
-                        with self.lock:
-                            self._access_page(pid, page_num, page_sequence)
-                        consecutive_errors = 0
-                    except Exception as e:
-                        self.logger.error(f"Page access error: {e}")
-                        consecutive_errors += 1
-                
+
+                self._do_tick()
+                consecutive_errors = 0
+
             except Exception as e:
                 self.logger.error(f"Error in simulation loop: {e}")
                 consecutive_errors += 1
                 if consecutive_errors >= max_errors:
                     self.running = False
                     break
-                time.sleep(1)
-        
+                # Back off, but stay responsive to stop_simulation
+                if self._stop_event.wait(1):
+                    break
+
         self.logger.info("Simulation loop stopped")
-    
-    def _access_page(self, pid: int, page_num: int, future_sequence: List[int]):
-        """Access a page for a process"""
-        # Verify process still exists
-        if pid not in self.processes:
+
+    def _do_tick(self):
+        """Simulate one page access
+
+        One critical section per tick: _access_page is pure in-memory
+        bookkeeping, so there is nothing to gain from releasing the lock
+        mid-tick. Every lookup is guarded by a predicate (.get / length
+        checks), so the happy path raises nothing.
+        """
+        with self.lock:
+            # Refill the pid batch when exhausted (or after
+            # add/remove_process invalidated it)
+            if self._pid_batch_i >= len(self._pid_batch):
+                if not self._pid_list:
+                    return
+                self._pid_batch = self._rng.choices(self._pid_list, k=64)
+                self._pid_batch_i = 0
+
+            pid = self._pid_batch[self._pid_batch_i]
+            self._pid_batch_i += 1
+            process = self.processes.get(pid)
+
+            if process is None or len(process.page_sequence) == 0:
+                return
+
+            # Walk the sequence with a circular cursor; no per-tick
+            # copy-and-rotate of the whole array
+            seq = process.page_sequence
+            cursor = process.page_cursor
+            page_num = int(seq[cursor])
+            process.page_cursor = (cursor + 1) % len(seq)
+
+            self._access_page(pid, page_num, seq, cursor)
+
+    def tick_to(self, now: float = None):
+        """Run the ticks that would have elapsed by `now` (pull model)
+
+        Alternative to the background thread for embedders that only
+        want the simulation to advance when they are about to read from
+        it: call tick_to() before get_statistics and the manager burns
+        zero CPU between reads. A no-op while the thread is running.
+        """
+        if self.running:
             return
-            
-        self.total_page_accesses += 1
-        
-        # Check if page is already in a frame
-        current_frame = self.page_table[pid].get(page_num)
-        
-        if current_frame is not None:
-            # Page hit
-            is_fault, _, recovery_time = self.algorithm.access_page(page_num, future_sequence[:50])  # Limit future sequence
+        if now is None:
+            now = time.monotonic()
+
+        elapsed = now - self._last_tick
+        n = int(elapsed / self._tick_interval)
+        if n <= 0:
             return
-        
-        # Page fault - use algorithm to determine replacement
-        is_fault, replaced_page, recovery_time = self.algorithm.access_page(
-            page_num, future_sequence[:50]  # Limit to prevent memory issues
-        )
-        
-        if is_fault:
+
+        # Cap the catch-up burst so a manager idle for hours doesn't
+        # replay them all at once; beyond the cap the backlog is dropped
+        for _ in range(min(n, 256)):
+            self._do_tick()
+        self._last_tick += n * self._tick_interval
+    
+    def _make_access_page(self):
+        """Build the per-tick access closure for the current algorithm
+
+        The structures that only change via change_algorithm and
+        change_frames are baked in as closure cells, so the hit path --
+        the common case -- runs without a single self.-attribute lookup.
+        """
+        processes = self.processes
+        page_table = self.page_table
+        access = self.algorithm.access_page
+        mark_referenced = self.algorithm.mark_referenced
+        stats_lock = self._stats_lock
+        record_fault = self._record_fault
+
+        def access_page_fast(pid: int, page_num: int, seq, cursor: int) -> None:
+            process = processes.get(pid)
+            if process is None:
+                return
+            page_map = page_table[pid]
+
+            with stats_lock:
+                self.total_page_accesses += 1
+
+            if page_map[page_num] != -1:
+                # Page hit: a reference-bit style notification is all
+                # the algorithm needs; no future window is built
+                mark_referenced(page_num)
+                return
+
+            # Page fault: build the 50-access lookahead window (only
+            # Optimal consumes it) and ask the algorithm for a victim
+            end = cursor + 50
+            if end <= len(seq):
+                window = seq[cursor:end]  # zero-copy view
+            else:
+                window = np.concatenate((seq[cursor:], seq[:end - len(seq)]))
+
+            is_fault, replaced_page, recovery_time = access(page_num, window)
+            if is_fault:
+                record_fault(process, page_map, pid, page_num,
+                             replaced_page, recovery_time)
+
+        return access_page_fast
+
+    def _record_fault(self, process, page_map, pid: int, page_num: int,
+                      replaced_page: Optional[int], recovery_time: float):
+        """Bookkeeping for a page fault: counters, frame, callback"""
+        with self._stats_lock:
             self.total_page_faults += 1
-            self.fault_recovery_times.append(recovery_time)
-            
-            # Limit recovery times list to prevent memory leak
-            if len(self.fault_recovery_times) > 10000:
-                self.fault_recovery_times = self.fault_recovery_times[-5000:]
-            
-            # Find or allocate a frame
-            frame_idx = self._allocate_frame(pid, page_num, replaced_page)
-            
-            # Update page table
-            self.page_table[pid][page_num] = frame_idx
-            
-            # Notify callback if registered
-            if self.page_fault_callback:
-                try:
-                    fault_info = {
-                        'pid': pid,
-                        'process_name': self.processes[pid].name,
-                        'page_num': page_num,
-                        'frame_num': frame_idx,
-                        'replaced_page': replaced_page,
-                        'recovery_time_ms': recovery_time,
-                        'total_faults': self.total_page_faults,
-                        'fault_rate': (self.total_page_faults / self.total_page_accesses * 100)
-                    }
-                    self.page_fault_callback(fault_info)
-                except Exception as e:
-                    self.logger.error(f"Callback error: {e}")
+            head = self._rec_head
+            if self._rec_count == len(self._rec_buf):
+                # Full: the slot being overwritten ages out of the sum
+                self._rec_sum -= float(self._rec_buf[head])
+            else:
+                self._rec_count += 1
+            self._rec_buf[head] = recovery_time
+            self._rec_sum += recovery_time
+            self._rec_head = (head + 1) % len(self._rec_buf)
+
+        # Find or allocate a frame
+        frame_idx = self._allocate_frame(pid, page_num, replaced_page)
+
+        # Update page table
+        page_map[page_num] = frame_idx
+
+        # Queue the notification for the dispatcher thread; drop it
+        # under backpressure rather than blocking the tick
+        if self._page_fault_callback and self._fault_q.qsize() < self._FAULT_Q_LIMIT:
+            self._fault_q.put_nowait(FaultInfo(
+                pid=pid,
+                process_name=process.name,
+                page_num=page_num,
+                frame_num=frame_idx,
+                replaced_page=replaced_page,
+                recovery_time_ms=recovery_time,
+                total_faults=self.total_page_faults,
+                fault_rate=(self.total_page_faults / self.total_page_accesses * 100)
+            ))
+
+    def _dispatch_faults(self):
+        """Deliver queued fault notifications off the simulation thread"""
+        while True:
+            fault_info = self._fault_q.get()
+            if fault_info is self._FAULT_Q_STOP:
+                break
+            callback = self._page_fault_callback
+            if callback is None:
+                continue
+            try:
+                callback(fault_info)
+            except Exception as e:
+                self.logger.error(f"Callback error: {e}")
     
     def _allocate_frame(self, pid: int, page_num: int, replaced_page: Optional[int]) -> int:
         """Allocate a frame for a page"""
         # Find empty frame or use replaced frame
         frame_idx = None
-        
-        # First try to find empty frame
-        for idx, content in enumerate(self.frame_table):
-            if content is None:
-                frame_idx = idx
-                break
-        
+
+        # First try the free list
+        if self._free_frames:
+            frame_idx = self._free_frames.popleft()
+            self._frames_used += 1
+
         # If no empty frame, replace according to algorithm
         if frame_idx is None:
             if replaced_page is not None:
-                # Find the frame containing the replaced page
-                for idx, content in enumerate(self.frame_table):
-                    if content and content[1] == replaced_page:
-                        frame_idx = idx
-                        # Update old process's page table
-                        old_pid, old_page = content
-                        if old_pid in self.page_table:
-                            self.page_table[old_pid][old_page] = None
-                        break
-            
+                # Reverse index gives the frame containing the replaced page
+                frame_idx = self._page_to_frame.pop(replaced_page, None)
+
             # Fallback to first available
             if frame_idx is None:
                 frame_idx = 0
-        
+
+            # Update the evicted process's page table
+            old_pid = int(self._frame_pid[frame_idx])
+            if old_pid != -1:
+                old_page = int(self._frame_page[frame_idx])
+                if old_pid in self.page_table:
+                    self.page_table[old_pid][old_page] = -1
+                if self._page_to_frame.get(old_page) == frame_idx:
+                    del self._page_to_frame[old_page]
+
         # Assign frame
-        self.frame_table[frame_idx] = (pid, page_num)
+        self._frame_pid[frame_idx] = pid
+        self._frame_page[frame_idx] = page_num
+        self._page_to_frame[page_num] = frame_idx
+        self._viz_dirty = True
         return frame_idx
     
-    def _generate_page_sequence(self, num_pages: int, length: int = 50) -> List[int]:
+    def _generate_page_sequence(self, num_pages: int, length: int = 50) -> np.ndarray:
         """Generate a realistic page access sequence with locality"""
         if num_pages == 0:
-            return []
-        
+            return np.empty(0, dtype=np.int32)
+
         # Reduced from 100 to 50 for better performance
-        sequence = []
-        current_page = random.randint(0, num_pages - 1)
-        
-        for _ in range(length):
-            sequence.append(current_page)
-            
+        sequence = np.empty(length, dtype=np.int32)
+
+        # Draw all the randomness up front in three C-level batches; the
+        # Python loop below only does the clamped walk arithmetic
+        rng = np.random.default_rng()
+        local = rng.random(length) < 0.7
+        offsets = rng.choice((-1, 0, 0, 1), size=length)
+        jumps = rng.integers(0, num_pages, size=length)
+
+        current_page = int(jumps[0])
+        max_page = num_pages - 1
+
+        for i in range(length):
+            sequence[i] = current_page
+
             # 70% chance of locality (nearby page)
             # 30% chance of random jump
-            if random.random() < 0.7:
+            if local[i]:
                 # Stay in locality
-                offset = random.choice([-1, 0, 0, 1])
-                current_page = max(0, min(num_pages - 1, current_page + offset))
+                current_page = max(0, min(max_page, current_page + int(offsets[i])))
             else:
                 # Random jump
-                current_page = random.randint(0, num_pages - 1)
-        
+                current_page = int(jumps[i])
+
         return sequence
     
+    def simulate(self, page_trace) -> dict:
+        """Replay a page trace with this manager's configuration
+
+        Runs on a fresh algorithm instance, so it never touches the live
+        simulation state and concurrent callers can share one cached
+        manager. Returns the algorithm's stats dict.
+        """
+        return simulate_trace(self.algorithm_name, page_trace, self.frame_count)
+
+    def reset_statistics(self):
+        """Reset fault/access counters and the recovery-time window"""
+        with self._stats_lock:
+            self.total_page_faults = 0
+            self.total_page_accesses = 0
+            self._rec_head = 0
+            self._rec_count = 0
+            self._rec_sum = 0.0
+        self.logger.info("Statistics reset")
+
     def get_statistics(self) -> dict:
-        """Get memory management statistics"""
-        with self.lock:
-            avg_recovery_time = (
-                sum(self.fault_recovery_times) / len(self.fault_recovery_times)
-                if self.fault_recovery_times else 0
-            )
-            
-            return {
-                'total_processes': len(self.processes),
-                'total_page_faults': self.total_page_faults,
-                'total_page_accesses': self.total_page_accesses,
-                'page_fault_rate': (
-                    self.total_page_faults / self.total_page_accesses * 100
-                    if self.total_page_accesses > 0 else 0
-                ),
-                'avg_recovery_time_ms': avg_recovery_time,
-                'frames_used': sum(1 for f in self.frame_table if f is not None),
-                'frames_total': self.frame_count,
-                'algorithm_stats': self.algorithm.get_stats()
-            }
+        """Get memory management statistics
+
+        Lock-free: every value here is a plain attribute the writers
+        keep up to date (frames_used is maintained incrementally rather
+        than counted), and under the GIL each individual read is atomic.
+        The snapshot is advisory -- values from the middle of a tick may
+        be one access apart -- which is fine for a stats poll.
+        """
+        total_faults = self.total_page_faults
+        total_accesses = self.total_page_accesses
+
+        return {
+            'total_processes': len(self.processes),
+            'total_page_faults': total_faults,
+            'total_page_accesses': total_accesses,
+            'page_fault_rate': (
+                total_faults / total_accesses * 100
+                if total_accesses > 0 else 0
+            ),
+            'avg_recovery_time_ms': self._rec_sum / max(1, self._rec_count),
+            'frames_used': self._frames_used,
+            'frames_total': self.frame_count,
+            'algorithm_stats': self.algorithm.get_stats()
+        }
     
     def get_frame_visualization(self) -> List[dict]:
         """Get frame table for visualization"""
         with self.lock:
+            frame_pids = self._frame_pid
+            frame_pages = self._frame_page
             frames = []
-            for idx, content in enumerate(self.frame_table):
-                if content:
-                    pid, page_num = content
+            for idx in range(len(frame_pids)):
+                pid = int(frame_pids[idx])
+                if pid != -1:
                     process = self.processes.get(pid)
                     frames.append({
                         'frame': idx,
                         'pid': pid,
-                        'page': page_num,
+                        'page': int(frame_pages[idx]),
                         'process_name': process.name if process else 'Unknown'
                     })
                 else:
@@ -332,4 +590,17 @@ class VirtualMemoryManager:
                         'page': None,
                         'process_name': 'Empty'
                     })
-            return frames
\ No newline at end of file
+            return frames
+
+    def get_frame_visualization_json(self) -> bytes:
+        """Frame table as JSON bytes, cached until the frames change
+
+        Repeated HTTP polls between simulation ticks are served from the
+        cached bytes without touching the lock or re-serializing.
+        """
+        if not self._viz_dirty and self._viz_cache is not None:
+            return self._viz_cache
+        payload = _dump_json(self.get_frame_visualization())
+        self._viz_cache = payload
+        self._viz_dirty = False
+        return payload
\ No newline at end of file
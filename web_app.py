@@ -1,23 +1,59 @@
-from flask import Flask, render_template, request
-from virtual_memory import VirtualMemoryManager
 import os
 
+import numpy as np
+from flask import Flask, render_template, request
+
+from page_replacement import ALGORITHMS, simulate
+
+try:
+    from waitress import serve
+except ImportError:
+    serve = None
+
 app = Flask(__name__)
 
+# Upper bounds on form inputs: LRU preallocates a node per frame, so an
+# unchecked frame count lets one request exhaust server memory
+MAX_FRAMES = 4096
+MAX_PAGE_SIZE_KB = 1024
+
+
 @app.route("/", methods=["GET", "POST"])
 def home():
     result = None
+    error = None
     if request.method == "POST":
         pages = request.form["pages"]
-        frames = int(request.form["frames"])
+        algorithm = request.form.get("algorithm", "LRU")
 
-        vm = VirtualMemoryManager(frames)
-        result = vm.simulate(pages.split())
+        try:
+            frames = int(request.form["frames"])
+            page_size = int(request.form.get("page_size", 4))
+            # Parse and convert the whole reference string in C; the
+            # int32 array flows into simulate without boxing each page
+            trace = np.fromstring(pages, dtype=np.int32, sep=" ")
+            if (not 1 <= frames <= MAX_FRAMES
+                    or not 1 <= page_size <= MAX_PAGE_SIZE_KB
+                    or len(trace) == 0
+                    or algorithm not in ALGORITHMS):
+                raise ValueError
+        except ValueError:
+            error = ("Enter space-separated page numbers, a frame count "
+                     f"between 1 and {MAX_FRAMES} and a known algorithm.")
+        else:
+            # The trace replay only needs the algorithm and frame count;
+            # run it straight through the batch simulator instead of
+            # keeping whole VirtualMemoryManager instances alive per
+            # configuration
+            result = simulate(algorithm, trace, frames)
 
-    return render_template("index.html", result=result)
+    return render_template("index.html", result=result, error=error)
 
 
 if __name__ == "__main__":
     port = int(os.environ.get("PORT", 5000))
-    app.run(host="0.0.0.0", port=port)
-
+    if serve is not None:
+        serve(app, host="0.0.0.0", port=port, threads=8)
+    else:
+        # waitress not installed; fall back to the Flask dev server
+        app.run(host="0.0.0.0", port=port)